@@ -1,8 +1,19 @@
 """Application configuration loaded from environment variables."""
 
+import os
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
+try:
+    # Snapshot written by scripts/freeze_env.py; skips parsing .env at startup
+    from app._env_frozen import _FROZEN
+
+    os.environ.update(_FROZEN)
+except ImportError:
+    from dotenv import load_dotenv
+
+    load_dotenv(override=True)
+
 
 class Settings(BaseSettings):
     """LuminaSAR application settings."""
@@ -13,15 +24,26 @@ class Settings(BaseSettings):
     supabase_service_role_key: str = ""
     database_url: str = ""
 
+    # Database connection pool
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_echo: bool = False
+
     # JWT
     jwt_secret_key: str = "default_dev_secret_key_change_in_production"
 
     # Ollama
     ollama_host: str = "http://localhost:11434"
     ollama_model: str = "llama3.2:latest"
+    llm_prompt_transactions: int = 25
 
     # ChromaDB
     chroma_persist_dir: str = "./chroma_db"
+    # sentence-transformers backend: "torch", or "onnx" / "openvino" for
+    # faster CPU-only inference (needs optimum[onnxruntime] / optimum[openvino])
+    embedding_backend: str = "torch"
 
     # App
     app_name: str = "LuminaSAR"
@@ -33,9 +55,11 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Settings singleton (cache removed for debugging)."""
-    from dotenv import load_dotenv
+    """Settings singleton.
 
-    load_dotenv(override=True)
+    Call ``get_settings.cache_clear()`` to pick up changed environment
+    variables (e.g. in tests).
+    """
     return Settings()
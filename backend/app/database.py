@@ -1,12 +1,20 @@
 """Database connection using SQLAlchemy + Supabase PostgreSQL."""
 
+import atexit
+import importlib
 import logging
+import uuid
+from functools import lru_cache
+
+import orjson
 
 logger = logging.getLogger("luminasar")
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import StaticPool
 from app.config import get_settings
 
 settings = get_settings()
@@ -14,74 +22,117 @@ settings = get_settings()
 # Base class for models
 Base = declarative_base()
 
-from sqlalchemy.engine import URL
-
-# Supabase DB Details (derived from settings.database_url or hardcoded for robustness)
-db_url = settings.database_url
-try:
-    if "@" in db_url:
-        # Reconstruct using URL.create to handle special characters correctly
-        creds, host_part = db_url.rsplit("@", 1)
-        scheme_user, password = creds.rsplit(":", 1)
-        scheme, user = scheme_user.split("://")
-
-        # Parse host and port
-        host_port = host_part.split("/")[0]
-        if ":" in host_port:
-            host, port = host_port.split(":")
-            port = int(port)
-        else:
-            host = host_port
-            port = 5432
-
-        database = host_part.split("/")[-1]
-
-        url_object = URL.create(
-            "postgresql",
-            username=user,
-            password=password,
-            host=host,
-            port=port,
-            database=database,
+
+def new_id() -> str:
+    """Primary key default shared by all models (canonical UUID string)."""
+    return str(uuid.uuid4())
+
+
+def _json_serializer(value) -> str:
+    """orjson encoder for JSON columns (stdlib json is several times slower)."""
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+def _build_url(db_url: str):
+    """Parse settings.database_url into a SQLAlchemy URL (None if unset)."""
+    if not db_url:
+        return None
+
+    url_object = make_url(db_url)
+    if url_object.drivername == "postgres":
+        url_object = url_object.set(drivername="postgresql")
+    logger.info(
+        f"🗄️ Database Connecting to {url_object.host}:{url_object.port} "
+        f"as {url_object.username}"
+    )
+    return url_object
+
+
+_MODEL_MODULES = (
+    "app.models.customer",
+    "app.models.transaction",
+    "app.models.sar_case",
+    "app.models.sar_narrative",
+    "app.models.audit_trail",
+)
+
+
+def _register_models_for_sqlite():
+    """Import model modules so they register with Base.metadata.
+
+    Only the SQLite fallback needs this (for create_all); the Postgres
+    path never pays the import cost here.
+    """
+    for module in _MODEL_MODULES:
+        importlib.import_module(module)
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Create the process-wide engine, falling back to local SQLite."""
+    try:
+        url_object = _build_url(settings.database_url)
+        # Try to connect once to verify Supabase
+        engine = create_engine(
+            url_object,
+            connect_args={"connect_timeout": 5},
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=True,
+            echo=settings.db_echo,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
-        logger.info(f"🗄️ Database Connecting to {host}:{port} as {user}")
-    else:
-        url_object = db_url
-        logger.info(f"🗄️ Database Connecting via direct URL")
-except Exception as e:
-    logger.error(f"❌ Database URL Parsing Failed: {e}")
-    url_object = db_url
-
-# Final engine selection with SQLite fallback for robustness
-try:
-    # Try to connect once to verify Supabase
-    temp_engine = create_engine(url_object, connect_args={"connect_timeout": 5})
-    with temp_engine.connect() as conn:
-        engine = temp_engine
-        logger.info("✅ Connected to Supabase PostgreSQL")
-except Exception as e:
-    logger.warning(f"⚠️ Supabase connection failed ({e}). Falling back to local SQLite.")
-    sqlite_url = "sqlite:///./luminasar.db"
-    engine = create_engine(sqlite_url, connect_args={"check_same_thread": False})
-
-    # Import models here to register them with Base.metadata
-    from app.models.customer import Customer
-    from app.models.transaction import Transaction
-    from app.models.sar_case import SARCase
-    from app.models.sar_narrative import SARNarrative
-    from app.models.audit_trail import AuditTrail
-
-    # Ensure tables are created in SQLite
-    Base.metadata.create_all(bind=engine)
-    logger.info("📁 Using local SQLite database (luminasar.db)")
-
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with engine.connect():
+            logger.info("✅ Connected to Supabase PostgreSQL")
+    except Exception as e:
+        logger.warning(
+            f"⚠️ Supabase connection failed ({e}). Falling back to local SQLite."
+        )
+        sqlite_url = make_url("sqlite:///./luminasar.db")
+        # StaticPool shares one connection between all sessions, which only an
+        # in-memory database needs (to stay alive). A file database gets the
+        # default pool, so concurrent sessions (DB work runs in worker
+        # threads) never share or roll back each other's transactions.
+        in_memory = sqlite_url.database in (None, "", ":memory:")
+        engine = create_engine(
+            sqlite_url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool if in_memory else None,
+            echo=settings.db_echo,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+        )
+
+        _register_models_for_sqlite()
+
+        # Ensure tables are created in SQLite
+        Base.metadata.create_all(bind=engine)
+        logger.info("📁 Using local SQLite database (luminasar.db)")
+
+    atexit.register(engine.dispose)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    """Session factory bound to the process-wide engine."""
+    return sessionmaker(
+        autocommit=False, autoflush=False, future=True, bind=get_engine()
+    )
+
+
+# Thread-local session registry for scripts and background jobs
+SessionLocal = scoped_session(lambda: get_session_factory()())
 
 
 def get_db():
     """Dependency that provides a database session."""
-    db = SessionLocal()
+    db = get_session_factory()()
     try:
         yield db
     finally:
@@ -6,7 +6,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import health, sar
 from app.config import get_settings
+import httpx
 import logging
+import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -44,11 +46,25 @@ app.include_router(sar.router, prefix="/api/v1/sar", tags=["SAR Generation"])
 @app.on_event("startup")
 async def startup_event():
     logger.info("🚀 LuminaSAR API Starting...")
+    app.state.http = httpx.AsyncClient(
+        timeout=3.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
     logger.info(f"📡 Ollama: {settings.ollama_host} ({settings.ollama_model})")
     logger.info(f"🗄️ Supabase: {settings.supabase_url}")
     logger.info("✅ Ready to generate SARs!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.http.aclose()
+
+    # The workflow is imported lazily on the first generate request
+    workflow = sys.modules.get("app.services.langgraph_workflow")
+    if workflow is not None:
+        await workflow.llm_service.aclose()
+
+
 @app.get("/")
 async def root():
     return {
@@ -1,16 +1,21 @@
 """Audit Trail model - maps to the audit_trail table in Supabase."""
 
-from sqlalchemy import Column, String, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, ForeignKey, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, new_id
+from app.utils.serialization import (
+    make_to_dict,
+    optional,
+    isoformat,
+    or_empty_dict,
+)
 from datetime import datetime
 
 
 class AuditTrail(Base):
     __tablename__ = "audit_trail"
 
-    audit_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    audit_id = Column(String, primary_key=True, default=new_id)
     narrative_id = Column(
         String, ForeignKey("sar_narratives.narrative_id"), nullable=True
     )
@@ -25,20 +30,21 @@ class AuditTrail(Base):
     # Relationships
     narrative = relationship("SARNarrative", back_populates="audit_entries")
 
+    # Leads with narrative_id, so it also serves plain narrative_id lookups
+    __table_args__ = (Index("ix_audit_narr_logged", "narrative_id", "logged_at"),)
+
     def __repr__(self):
-        return (
-            f"<AuditTrail(step='{self.step_name}', hash='{self.current_hash[:8]}...')>"
-        )
-
-    def to_dict(self) -> dict:
-        return {
-            "audit_id": str(self.audit_id),
-            "narrative_id": str(self.narrative_id) if self.narrative_id else None,
-            "step_name": self.step_name,
-            "data_sources": self.data_sources or {},
-            "reasoning": self.reasoning or {},
-            "confidence_scores": self.confidence_scores or {},
-            "logged_at": self.logged_at.isoformat() if self.logged_at else None,
-            "previous_hash": self.previous_hash,
-            "current_hash": self.current_hash,
-        }
+        short_hash = (self.current_hash or "")[:8]
+        return f"<AuditTrail(step='{self.step_name}', hash='{short_hash}...')>"
+
+    to_dict = make_to_dict(
+        ("audit_id", str),
+        ("narrative_id", optional(str)),
+        "step_name",
+        ("data_sources", or_empty_dict),
+        ("reasoning", or_empty_dict),
+        ("confidence_scores", or_empty_dict),
+        ("logged_at", isoformat),
+        "previous_hash",
+        "current_hash",
+    )
@@ -2,14 +2,14 @@
 
 from sqlalchemy import Column, String, Numeric, Date
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, new_id
+from app.utils.serialization import make_to_dict, optional
 
 
 class Customer(Base):
     __tablename__ = "customers"
 
-    customer_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    customer_id = Column(String, primary_key=True, default=new_id)
     name = Column(String, nullable=False)
     account_number = Column(String, nullable=False, unique=True)
     occupation = Column(String, nullable=True)
@@ -25,12 +25,11 @@ class Customer(Base):
     def __repr__(self):
         return f"<Customer(name='{self.name}', account='{self.account_number}')>"
 
-    def to_dict(self) -> dict:
-        return {
-            "customer_id": str(self.customer_id),
-            "name": self.name,
-            "account_number": self.account_number,
-            "occupation": self.occupation,
-            "stated_income": float(self.stated_income) if self.stated_income else None,
-            "customer_since": str(self.customer_since) if self.customer_since else None,
-        }
+    to_dict = make_to_dict(
+        ("customer_id", str),
+        "name",
+        "account_number",
+        "occupation",
+        ("stated_income", optional(float)),
+        ("customer_since", optional(str)),
+    )
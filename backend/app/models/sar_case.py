@@ -1,17 +1,24 @@
 """SAR Case model - maps to the sar_cases table in Supabase."""
 
-from sqlalchemy import Column, String, Numeric, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, Numeric, ForeignKey, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, new_id
+from app.utils.serialization import (
+    make_to_dict,
+    optional,
+    isoformat,
+    or_empty_list,
+)
 from datetime import datetime
 
 
 class SARCase(Base):
     __tablename__ = "sar_cases"
 
-    case_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    customer_id = Column(String, ForeignKey("customers.customer_id"), nullable=True)
+    case_id = Column(String, primary_key=True, default=new_id)
+    customer_id = Column(
+        String, ForeignKey("customers.customer_id"), nullable=True, index=True
+    )
     status = Column(String, nullable=True, default="pending")
     risk_score = Column(Numeric, nullable=True)
     typologies = Column(JSON, nullable=True, default=[])
@@ -22,16 +29,20 @@ class SARCase(Base):
     customer = relationship("Customer", back_populates="sar_cases")
     narratives = relationship("SARNarrative", back_populates="sar_case", lazy="dynamic")
 
+    __table_args__ = (
+        Index("ix_case_created_desc", created_at.desc()),
+        Index("ix_case_status_risk", "status", "risk_score"),
+    )
+
     def __repr__(self):
         return f"<SARCase(id='{self.case_id}', status='{self.status}')>"
 
-    def to_dict(self) -> dict:
-        return {
-            "case_id": str(self.case_id),
-            "customer_id": str(self.customer_id) if self.customer_id else None,
-            "status": self.status,
-            "risk_score": float(self.risk_score) if self.risk_score else None,
-            "typologies": self.typologies or [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    to_dict = make_to_dict(
+        ("case_id", str),
+        ("customer_id", optional(str)),
+        "status",
+        ("risk_score", optional(float)),
+        ("typologies", or_empty_list),
+        ("created_at", isoformat),
+        ("updated_at", isoformat),
+    )
@@ -2,16 +2,18 @@
 
 from sqlalchemy import Column, String, Numeric, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
-from app.database import Base
-import uuid
+from app.database import Base, new_id
+from app.utils.serialization import make_to_dict, optional, isoformat
 from datetime import datetime
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    transaction_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    customer_id = Column(String, ForeignKey("customers.customer_id"), nullable=True)
+    transaction_id = Column(String, primary_key=True, default=new_id)
+    customer_id = Column(
+        String, ForeignKey("customers.customer_id"), nullable=True, index=True
+    )
     amount = Column(Numeric, nullable=False)
     date = Column(DateTime, nullable=True, default=datetime.utcnow)
     source_account = Column(String, nullable=True)
@@ -24,13 +26,12 @@ class Transaction(Base):
     def __repr__(self):
         return f"<Transaction(id='{self.transaction_id}', amount={self.amount})>"
 
-    def to_dict(self) -> dict:
-        return {
-            "transaction_id": str(self.transaction_id),
-            "customer_id": str(self.customer_id) if self.customer_id else None,
-            "amount": float(self.amount),
-            "date": self.date.isoformat() if self.date else None,
-            "source_account": self.source_account,
-            "destination_account": self.destination_account,
-            "transaction_type": self.transaction_type,
-        }
+    to_dict = make_to_dict(
+        ("transaction_id", str),
+        ("customer_id", optional(str)),
+        ("amount", float),
+        ("date", isoformat),
+        "source_account",
+        "destination_account",
+        "transaction_type",
+    )
@@ -1,39 +1,51 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+import logging
+
+from fastapi import APIRouter, Request
+from cachetools import TTLCache
 from app.schemas.response import HealthResponse
 from app.config import get_settings
-import httpx
 
+logger = logging.getLogger("luminasar.health")
 router = APIRouter()
 settings = get_settings()
 
+# Load balancers poll /health every few seconds; amortize the probes
+_probe_cache = TTLCache(maxsize=2, ttl=5)
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(request: Request):
     """Check the health of all services."""
 
     # Check Ollama
-    ollama_connected = False
-    try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            resp = await client.get(f"{settings.ollama_host}/api/tags")
+    ollama_connected = _probe_cache.get("ollama")
+    if ollama_connected is None:
+        ollama_connected = False
+        try:
+            resp = await request.app.state.http.get(
+                f"{settings.ollama_host}/api/tags", timeout=3.0
+            )
             ollama_connected = resp.status_code == 200
-    except Exception:
-        pass
+        except Exception as e:
+            logger.warning("⚠️ Ollama health probe failed: %s", e, exc_info=True)
+        _probe_cache["ollama"] = ollama_connected
 
     # Check database
-    db_connected = False
-    try:
-        from app.database import engine
-        from sqlalchemy import text
-
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            db_connected = True
-    except Exception as e:
-        print(f"DEBUG DB HEALTH ERROR: {e}")
-        pass
+    db_connected = _probe_cache.get("db")
+    if db_connected is None:
+        db_connected = False
+        try:
+            from app.database import get_engine
+            from sqlalchemy import text
+
+            with get_engine().connect() as conn:
+                conn.execute(text("SELECT 1"))
+                db_connected = True
+        except Exception as e:
+            logger.warning("⚠️ Database health probe failed: %s", e, exc_info=True)
+        _probe_cache["db"] = db_connected
 
     return HealthResponse(
         status="healthy" if (ollama_connected and db_connected) else "degraded",
@@ -1,9 +1,12 @@
 """SAR generation and management routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy import func, exists, select
 from typing import List
+from cachetools import TTLCache
+import hashlib
 import time
 import traceback
 
@@ -25,36 +28,66 @@ from app.schemas.response import (
 
 router = APIRouter()
 
+# Dashboard stats don't need second-level freshness
+_stats_cache = TTLCache(maxsize=1, ttl=10)
+
+
+def _load_case(db: Session, case_id: str, with_existing: bool = True):
+    """Fetch a case, its existing narrative and that narrative's audit step count.
+
+    Returns a ``(case, narrative, audit_steps)`` row, or None if the case
+    does not exist. Either way exactly one SELECT is issued: the case's
+    customer relationship is lazy and left unloaded. With
+    ``with_existing=False`` only the case is fetched and the other two values
+    are None.
+    """
+    if not with_existing:
+        case = db.execute(
+            select(SARCase).where(SARCase.case_id == case_id)
+        ).scalar_one_or_none()
+        return (case, None, None) if case else None
+
+    audit_steps = (
+        select(func.count(AuditTrail.audit_id))
+        .where(AuditTrail.narrative_id == SARNarrative.narrative_id)
+        .correlate(SARNarrative)
+        .scalar_subquery()
+    )
+    return (
+        db.execute(
+            select(SARCase, SARNarrative, audit_steps)
+            .outerjoin(SARNarrative, SARNarrative.case_id == SARCase.case_id)
+            .where(SARCase.case_id == case_id)
+            .limit(1)
+        )
+        .first()
+    )
+
 
 @router.post("/generate", response_model=GenerateResponse)
 async def generate_sar(request: GenerateSARRequest, db: Session = Depends(get_db)):
     """Generate a SAR narrative for a given case ID."""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
-    # Find the case
-    case = db.query(SARCase).filter(SARCase.case_id == request.case_id).first()
-    if not case:
+    # Find the case (sync DB calls run in the threadpool to keep the loop free)
+    row = await run_in_threadpool(
+        _load_case, db, request.case_id, not request.force_regenerate
+    )
+    if not row:
         raise HTTPException(status_code=404, detail=f"Case {request.case_id} not found")
+    case, existing, audit_steps = row
 
     # Check if narrative already exists
-    if not request.force_regenerate:
-        existing = (
-            db.query(SARNarrative)
-            .filter(SARNarrative.case_id == request.case_id)
-            .first()
+    if existing and not request.force_regenerate:
+        return GenerateResponse(
+            narrative_id=str(existing.narrative_id),
+            case_id=str(case.case_id),
+            narrative_text=existing.narrative_text,
+            risk_score=float(case.risk_score) if case.risk_score else 0.0,
+            typologies=case.typologies or [],
+            generation_time_seconds=existing.generation_time_seconds or 0,
+            audit_steps=audit_steps or 0,
         )
-        if existing:
-            return GenerateResponse(
-                narrative_id=str(existing.narrative_id),
-                case_id=str(case.case_id),
-                narrative_text=existing.narrative_text,
-                risk_score=float(case.risk_score) if case.risk_score else 0.0,
-                typologies=case.typologies or [],
-                generation_time_seconds=existing.generation_time_seconds or 0,
-                audit_steps=db.query(AuditTrail)
-                .filter(AuditTrail.narrative_id == existing.narrative_id)
-                .count(),
-            )
 
     try:
         # Import workflow
@@ -62,7 +95,7 @@ async def generate_sar(request: GenerateSARRequest, db: Session = Depends(get_db
 
         result = await run_sar_workflow(str(case.case_id), str(case.customer_id), db)
 
-        generation_time = int(time.time() - start_time)
+        generation_time = int(time.perf_counter() - start_time)
 
         return GenerateResponse(
             narrative_id=result["narrative_id"],
@@ -79,22 +112,46 @@ async def generate_sar(request: GenerateSARRequest, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail=f"SAR generation failed: {str(e)}")
 
 
+def _not_modified(request: Request, response: Response, etag: str) -> bool:
+    """Set the ETag header and report whether the client's copy is current."""
+    response.headers["ETag"] = etag
+    return request.headers.get("if-none-match") == etag
+
+
 @router.get("/{narrative_id}", response_model=SARResponse)
-async def get_narrative(narrative_id: str, db: Session = Depends(get_db)):
+async def get_narrative(
+    narrative_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get a specific SAR narrative by ID."""
-    narrative = (
-        db.query(SARNarrative).filter(SARNarrative.narrative_id == narrative_id).first()
-    )
+    narrative = db.execute(
+        select(SARNarrative).where(SARNarrative.narrative_id == narrative_id)
+    ).scalar_one_or_none()
 
     if not narrative:
         raise HTTPException(status_code=404, detail="Narrative not found")
 
-    case = db.query(SARCase).filter(SARCase.case_id == narrative.case_id).first()
-    customer = (
-        db.query(Customer).filter(Customer.customer_id == case.customer_id).first()
-        if case
-        else None
+    # The response reads the case's customer; load it in the same SELECT
+    case = db.execute(
+        select(SARCase)
+        .options(joinedload(SARCase.customer))
+        .where(SARCase.case_id == narrative.case_id)
+    ).scalar_one_or_none()
+
+    # Narratives are immutable; only the case status/score can change
+    generated_ts = (
+        int(narrative.generated_at.timestamp()) if narrative.generated_at else 0
     )
+    etag = (
+        f'W/"{narrative_id}-{generated_ts}-'
+        f'{case.status if case else None}-{case.risk_score if case else None}"'
+    )
+    if _not_modified(request, response, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    customer = case.customer if case else None
 
     return SARResponse(
         narrative_id=str(narrative.narrative_id),
@@ -113,45 +170,82 @@ async def get_narrative(narrative_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{narrative_id}/audit", response_model=AuditTrailResponse)
-async def get_audit_trail(narrative_id: str, db: Session = Depends(get_db)):
+async def get_audit_trail(
+    narrative_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """Get the complete audit trail for a SAR narrative."""
+    # The ETag covers every row's hash pair, not just the chain tip, so an
+    # edited link anywhere in the trail changes it (and chain_valid with it)
+    hash_pairs = db.execute(
+        select(AuditTrail.previous_hash, AuditTrail.current_hash)
+        .where(AuditTrail.narrative_id == narrative_id)
+        .order_by(AuditTrail.logged_at)
+    ).all()
+    if hash_pairs:
+        digest = hashlib.sha256()
+        for previous_hash, current_hash in hash_pairs:
+            digest.update(f"{previous_hash}:{current_hash};".encode())
+        etag = f'W/"{digest.hexdigest()}"'
+        if _not_modified(request, response, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+    # Each row's link to its predecessor is checked in SQL via LAG(); the
+    # first row defaults to its own previous_hash so it always links
+    link_valid = AuditTrail.previous_hash.is_not_distinct_from(
+        func.lag(AuditTrail.current_hash, 1, AuditTrail.previous_hash).over(
+            order_by=AuditTrail.logged_at
+        )
+    ).label("link_valid")
+
     audit_entries = (
-        db.query(AuditTrail)
+        db.query(AuditTrail, link_valid)
+        .options(
+            load_only(
+                AuditTrail.audit_id,
+                AuditTrail.step_name,
+                AuditTrail.data_sources,
+                AuditTrail.reasoning,
+                AuditTrail.confidence_scores,
+                AuditTrail.logged_at,
+                AuditTrail.previous_hash,
+                AuditTrail.current_hash,
+            )
+        )
         .filter(AuditTrail.narrative_id == narrative_id)
         .order_by(AuditTrail.logged_at)
-        .all()
+        .yield_per(100)
     )
 
-    if not audit_entries:
-        raise HTTPException(status_code=404, detail="Audit trail not found")
-
-    # Verify hash chain integrity
+    # Fold the per-row chain checks while building the response in one pass
     chain_valid = True
-    for i in range(1, len(audit_entries)):
-        if audit_entries[i].previous_hash != audit_entries[i - 1].current_hash:
-            chain_valid = False
-            break
-
-    steps = [
-        AuditStepResponse(
-            audit_id=str(entry.audit_id),
-            step_name=entry.step_name,
-            data_sources=entry.data_sources or {},
-            reasoning=entry.reasoning or {},
-            confidence_scores=entry.confidence_scores or {},
-            logged_at=entry.logged_at.isoformat() if entry.logged_at else None,
-            previous_hash=entry.previous_hash,
-            current_hash=entry.current_hash,
+    steps = []
+    last = None
+    for entry, entry_link_valid in audit_entries:
+        chain_valid &= bool(entry_link_valid)
+        steps.append(
+            AuditStepResponse(
+                audit_id=str(entry.audit_id),
+                step_name=entry.step_name,
+                data_sources=entry.data_sources or {},
+                reasoning=entry.reasoning or {},
+                confidence_scores=entry.confidence_scores or {},
+                logged_at=entry.logged_at.isoformat() if entry.logged_at else None,
+                previous_hash=entry.previous_hash,
+                current_hash=entry.current_hash,
+            )
         )
-        for entry in audit_entries
-    ]
+        last = entry
+
+    if last is None:
+        raise HTTPException(status_code=404, detail="Audit trail not found")
 
     # Get sentence attribution from the last audit step
     sentence_attribution = {}
-    if audit_entries:
-        last = audit_entries[-1]
-        if last.data_sources and "sentence_attribution" in last.data_sources:
-            sentence_attribution = last.data_sources["sentence_attribution"]
+    if last.data_sources and "sentence_attribution" in last.data_sources:
+        sentence_attribution = last.data_sources["sentence_attribution"]
 
     return AuditTrailResponse(
         narrative_id=narrative_id,
@@ -166,14 +260,16 @@ async def approve_sar(
     narrative_id: str, request: ApproveSARRequest, db: Session = Depends(get_db)
 ):
     """Approve a SAR narrative for filing."""
-    narrative = (
-        db.query(SARNarrative).filter(SARNarrative.narrative_id == narrative_id).first()
-    )
+    narrative = db.execute(
+        select(SARNarrative).where(SARNarrative.narrative_id == narrative_id)
+    ).scalar_one_or_none()
 
     if not narrative:
         raise HTTPException(status_code=404, detail="Narrative not found")
 
-    case = db.query(SARCase).filter(SARCase.case_id == narrative.case_id).first()
+    case = db.execute(
+        select(SARCase).where(SARCase.case_id == narrative.case_id)
+    ).scalar_one_or_none()
     if case:
         case.status = "approved"
         db.commit()
@@ -189,19 +285,19 @@ async def approve_sar(
 @router.get("/", response_model=List[CaseResponse])
 async def get_recent_cases(limit: int = 20, db: Session = Depends(get_db)):
     """Get recent SAR cases."""
-    cases = db.query(SARCase).order_by(SARCase.created_at.desc()).limit(limit).all()
+    has_narrative = (
+        exists().where(SARNarrative.case_id == SARCase.case_id).label("has_narrative")
+    )
+    rows = (
+        db.query(SARCase, Customer, has_narrative)
+        .outerjoin(Customer, SARCase.customer_id == Customer.customer_id)
+        .order_by(SARCase.created_at.desc())
+        .limit(limit)
+        .all()
+    )
 
     result = []
-    for case in cases:
-        customer = (
-            db.query(Customer).filter(Customer.customer_id == case.customer_id).first()
-        )
-
-        has_narrative = (
-            db.query(SARNarrative).filter(SARNarrative.case_id == case.case_id).count()
-            > 0
-        )
-
+    for case, customer, case_has_narrative in rows:
         result.append(
             CaseResponse(
                 case_id=str(case.case_id),
@@ -211,7 +307,7 @@ async def get_recent_cases(limit: int = 20, db: Session = Depends(get_db)):
                 risk_score=float(case.risk_score) if case.risk_score else None,
                 typologies=case.typologies or [],
                 created_at=case.created_at.isoformat() if case.created_at else None,
-                has_narrative=has_narrative,
+                has_narrative=bool(case_has_narrative),
             )
         )
 
@@ -221,21 +317,33 @@ async def get_recent_cases(limit: int = 20, db: Session = Depends(get_db)):
 @router.get("/stats/overview", response_model=StatsResponse)
 async def get_stats(db: Session = Depends(get_db)):
     """Get dashboard statistics."""
-    total_sars = db.query(SARNarrative).count()
-    pending_cases = db.query(SARCase).filter(SARCase.status == "pending").count()
-    total_customers = db.query(Customer).count()
+    cached = _stats_cache.get("stats")
+    if cached is not None:
+        return cached
+
+    # One round trip: each aggregate is a scalar subquery of a single SELECT
+    total_sars, avg_time, pending_cases, high_risk, total_customers = db.execute(
+        select(
+            select(func.count(SARNarrative.narrative_id)).scalar_subquery(),
+            select(func.avg(SARNarrative.generation_time_seconds)).scalar_subquery(),
+            select(func.count(SARCase.case_id))
+            .where(SARCase.status == "pending")
+            .scalar_subquery(),
+            # High risk cases (score > 7)
+            select(func.count(SARCase.case_id))
+            .where(SARCase.risk_score > 7)
+            .scalar_subquery(),
+            select(func.count(Customer.customer_id)).scalar_subquery(),
+        )
+    ).one()
 
     # Average generation time
-    avg_time = db.query(func.avg(SARNarrative.generation_time_seconds)).scalar()
     avg_time = float(avg_time) if avg_time else 0.0
 
-    # High risk cases (score > 7)
-    high_risk = db.query(SARCase).filter(SARCase.risk_score > 7).count()
-
     # Estimated cost savings: ₹5000/SAR manual cost, each SAR saved ~5 hours
     cost_savings = total_sars * 5000 / 100000  # In lakhs
 
-    return StatsResponse(
+    stats = StatsResponse(
         total_sars=total_sars,
         pending_cases=pending_cases,
         avg_generation_time=round(avg_time, 1),
@@ -243,3 +351,5 @@ async def get_stats(db: Session = Depends(get_db)):
         high_risk_cases=high_risk,
         cost_savings_lakhs=round(cost_savings, 1),
     )
+    _stats_cache["stats"] = stats
+    return stats
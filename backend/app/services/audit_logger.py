@@ -12,18 +12,41 @@ import hashlib
 import json
 from datetime import datetime, timezone
 from typing import Dict, List
-from app.utils.hash import compute_hash, GENESIS_HASH
+from app.utils.hash import (
+    chain_digest,
+    compute_chain_hash,
+    GENESIS_HASH,
+    GENESIS_HASH_BYTES,
+)
 import logging
 import re
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger("luminasar.audit")
 
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+# Entry fields covered by the hash chain (previous_hash is chained as bytes)
+_HASHED_FIELDS = (
+    "step_name",
+    "data_sources",
+    "reasoning",
+    "confidence_scores",
+    "logged_at",
+)
+
 
 class AuditLogger:
     """Creates and manages hash-chained audit logs."""
 
     def __init__(self):
         self.logs: List[Dict] = []
+        # Raw digest of the chain tip, so log_step never decodes hex
+        self._last_hash_bytes: bytes = GENESIS_HASH_BYTES
 
     def log_step(
         self,
@@ -51,9 +74,11 @@ class AuditLogger:
             "previous_hash": self._get_last_hash(),
         }
 
-        log_entry["current_hash"] = compute_hash(
-            log_entry, exclude_keys=["current_hash"]
+        digest = chain_digest(
+            self._last_hash_bytes, {k: log_entry[k] for k in _HASHED_FIELDS}
         )
+        log_entry["current_hash"] = digest.hex()
+        self._last_hash_bytes = digest
         self.logs.append(log_entry)
         logger.info(
             f"📋 Audit: {step_name} (hash: {log_entry['current_hash'][:16]}...)"
@@ -72,7 +97,7 @@ class AuditLogger:
                 return False
 
             # Recompute and verify current hash
-            expected = compute_hash(self.logs[i], exclude_keys=["current_hash"])
+            expected = _hash_entry(self.logs[i])
             if self.logs[i]["current_hash"] != expected:
                 return False
 
@@ -85,6 +110,10 @@ class AuditLogger:
 
         This is the INNOVATION SHOWCASE — sentence-level data tracing.
 
+        All transaction tokens (short ID, amount, accounts) are indexed once
+        and each sentence is scanned a single time, instead of checking every
+        token of every transaction against every sentence.
+
         Args:
             narrative: Generated SAR narrative text
             transactions: Source transaction data
@@ -92,33 +121,26 @@ class AuditLogger:
         Returns:
             Dictionary mapping sentence index to its data sources
         """
-        sentences = [s.strip() for s in re.split(r"[.!?]+", narrative) if s.strip()]
+        token_index = _build_token_index(transactions)
+        find_tokens = _make_token_finder(token_index)
         attribution = {}
 
-        for i, sentence in enumerate(sentences):
+        for i, sentence in enumerate(_iter_sentences(narrative)):
             mentioned_ids = []
             mentioned_amounts = []
             mentioned_accounts = []
 
-            for txn in transactions:
-                txn_id = str(txn.get("transaction_id", ""))
-                amount = str(txn.get("amount", ""))
-                source = str(txn.get("source_account", ""))
-                dest = str(txn.get("destination_account", ""))
-
-                # Check if transaction ID (or short form) appears in sentence
-                if txn_id[:8] in sentence:
-                    mentioned_ids.append(txn_id)
-
-                # Check if amount appears in sentence
-                if amount and amount in sentence:
-                    mentioned_amounts.append(float(txn.get("amount", 0)))
-
-                # Check if account numbers appear
-                if source and source in sentence:
-                    mentioned_accounts.append(source)
-                if dest and dest in sentence:
-                    mentioned_accounts.append(dest)
+            # Restore per-transaction ordering of the original nested scan
+            refs = sorted(
+                ref for token in find_tokens(sentence) for ref in token_index[token]
+            )
+            for _, _, kind, value in refs:
+                if kind == "id":
+                    mentioned_ids.append(value)
+                elif kind == "amount":
+                    mentioned_amounts.append(value)
+                else:
+                    mentioned_accounts.append(value)
 
             attribution[f"sentence_{i}"] = {
                 "text": sentence,
@@ -136,3 +158,69 @@ class AuditLogger:
     def reset(self):
         """Reset the audit logger for a new generation."""
         self.logs = []
+        self._last_hash_bytes = GENESIS_HASH_BYTES
+
+
+def _iter_sentences(text: str):
+    """Yield stripped, non-empty sentences without building a split list."""
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        sentence = text[start : match.start()].strip()
+        if sentence:
+            yield sentence
+        start = match.end()
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
+
+def _hash_entry(entry: Dict) -> str:
+    """Chain hash of a log entry from its previous hash and hashed fields."""
+    return compute_chain_hash(
+        entry["previous_hash"], {k: entry[k] for k in _HASHED_FIELDS}
+    )
+
+
+def _build_token_index(transactions: List[Dict]) -> Dict[str, List[tuple]]:
+    """Index every searchable transaction token.
+
+    Maps each token string to ``(txn_index, slot, kind, value)`` references,
+    where ``slot`` preserves the id/amount/source/dest check order.
+    """
+    index: Dict[str, List[tuple]] = {}
+    for n, txn in enumerate(transactions):
+        txn_id = str(txn.get("transaction_id", ""))
+        amount = str(txn.get("amount", ""))
+        source = str(txn.get("source_account", ""))
+        dest = str(txn.get("destination_account", ""))
+
+        index.setdefault(txn_id[:8], []).append((n, 0, "id", txn_id))
+        if amount:
+            index.setdefault(amount, []).append(
+                (n, 1, "amount", float(txn.get("amount", 0)))
+            )
+        if source:
+            index.setdefault(source, []).append((n, 2, "account", source))
+        if dest:
+            index.setdefault(dest, []).append((n, 3, "account", dest))
+    return index
+
+
+def _make_token_finder(token_index: Dict[str, List[tuple]]):
+    """Return a function yielding the distinct indexed tokens found in a text."""
+    # An empty token (e.g. a missing transaction ID) matches every sentence
+    always = [""] if "" in token_index else []
+
+    if ahocorasick is None:
+        tokens = [t for t in token_index if t]
+        return lambda text: always + [t for t in tokens if t in text]
+
+    automaton = ahocorasick.Automaton()
+    for token in token_index:
+        if token:
+            automaton.add_word(token, token)
+    if len(automaton) == 0:
+        return lambda text: always
+    automaton.make_automaton()
+
+    return lambda text: always + list({t for _, t in automaton.iter(text)})
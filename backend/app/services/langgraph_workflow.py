@@ -6,12 +6,23 @@ Pipeline: fetch_data → analyze_patterns → retrieve_templates →
 Each step is logged to the audit trail with hash-chain integrity.
 """
 
-from typing import TypedDict, List, Dict, Optional
+from dataclasses import dataclass, field
+from itertools import islice
+from types import MappingProxyType
+from typing import List, Dict, Optional
+import asyncio
+import numpy as np
 import pandas as pd
+from sqlalchemy import insert, select, update
 import time
 import logging
 from datetime import datetime, timezone
 
+from app.models.audit_trail import AuditTrail as AuditTrailModel
+from app.models.customer import Customer
+from app.models.sar_case import SARCase
+from app.models.sar_narrative import SARNarrative
+from app.models.transaction import Transaction
 from app.services.pattern_detector import PatternDetector
 from app.services.rag_service import RAGService
 from app.services.llm_service import LLMService
@@ -23,23 +34,47 @@ logger = logging.getLogger("luminasar.workflow")
 settings = get_settings()
 
 
-class SARState(TypedDict):
+@dataclass(slots=True)
+class SARState:
     """State object passed through the workflow pipeline."""
 
     case_id: str
     customer_id: str
-    customer_data: Dict
-    transactions: List[Dict]
-    patterns: Dict
-    typologies: List[str]
-    templates: List[str]
-    narrative: str
-    audit_logs: List[Dict]
-    error: Optional[str]
-    narrative_id: Optional[str]
-    risk_score: float
-    audit_steps: int
-
+    customer_data: Dict = field(default_factory=dict)
+    transactions: List[Dict] = field(default_factory=list)
+    transactions_df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    patterns: Dict = field(default_factory=dict)
+    typologies: List[str] = field(default_factory=list)
+    templates: List[str] = field(default_factory=list)
+    narrative: str = ""
+    audit_logs: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    narrative_id: Optional[str] = None
+    risk_score: float = 0.0
+    audit_steps: int = 0
+    # Monotonic start time, immune to wall-clock adjustments
+    started_at: float = field(default_factory=time.perf_counter)
+
+
+# String columns of the transactions DataFrame built in _fetch_data
+_TRANSACTION_STRING_COLUMNS = (
+    "transaction_id",
+    "source_account",
+    "destination_account",
+    "transaction_type",
+)
+
+# Constant audit metadata, built once instead of per logged step
+_DETECTION_ALGORITHMS = (
+    "velocity_analysis",
+    "volume_analysis",
+    "structuring_detection",
+    "network_graph_analysis",
+    "typology_matching",
+)
+_RAG_SOURCES = MappingProxyType(
+    {"vector_store": "chromadb", "embedding_model": "all-MiniLM-L6-v2"}
+)
 
 # Initialize services (singletons)
 pattern_detector = PatternDetector()
@@ -60,46 +95,44 @@ async def run_sar_workflow(case_id: str, customer_id: str, db) -> Dict:
         Dictionary with narrative_id, narrative text, risk_score, typologies, audit_steps
     """
     logger.info(f"🚀 Starting SAR workflow for case {case_id}")
-    start_time = time.time()
     audit_logger = AuditLogger()
 
-    state: SARState = {
-        "case_id": case_id,
-        "customer_id": customer_id,
-        "customer_data": {},
-        "transactions": [],
-        "patterns": {},
-        "typologies": [],
-        "templates": [],
-        "narrative": "",
-        "audit_logs": [],
-        "error": None,
-        "narrative_id": None,
-        "risk_score": 0.0,
-        "audit_steps": 0,
-    }
+    state = SARState(case_id=case_id, customer_id=customer_id)
 
     # === STEP 1: Fetch Data ===
+    # Database steps run in a worker thread so the event loop stays free.
+    # Steps are awaited in turn, so this request's session is used by one
+    # thread at a time; other requests have their own sessions and pooled
+    # connections (tests/test_concurrent_generation.py checks this on the
+    # SQLite fallback)
     logger.info("📥 Step 1: Fetching data...")
-    state = _fetch_data(state, db, audit_logger)
-    if state["error"]:
-        raise Exception(state["error"])
+    state = await asyncio.to_thread(_fetch_data, state, db, audit_logger)
+    if state.error:
+        raise Exception(state.error)
 
     # === STEP 2: Analyze Patterns ===
+    # Template retrieval needs the detected typologies, but loading the vector
+    # store and embedding model does not, so overlap it with the analysis
     logger.info("🔍 Step 2: Analyzing patterns...")
-    state = _analyze_patterns(state, audit_logger)
-    if state["error"]:
-        raise Exception(state["error"])
+    state, _ = await asyncio.gather(
+        asyncio.to_thread(_analyze_patterns, state, audit_logger),
+        asyncio.to_thread(rag_service.warm_up),
+    )
+    if state.error:
+        raise Exception(state.error)
 
     # === STEP 3: Retrieve Templates ===
+    # The Chroma query is synchronous; keep it off the event loop. It may run
+    # alongside other requests' warm_up, which RAGService's init lock
+    # serializes (tests/test_rag_service.py)
     logger.info("📚 Step 3: Retrieving templates...")
-    state = _retrieve_templates(state, audit_logger)
+    state = await asyncio.to_thread(_retrieve_templates, state, audit_logger)
 
     # === STEP 4: Generate Narrative ===
     logger.info("🤖 Step 4: Generating narrative...")
     state = await _generate_narrative(state, audit_logger)
-    if state["error"]:
-        raise Exception(state["error"])
+    if state.error:
+        raise Exception(state.error)
 
     # === STEP 5: Validate ===
     logger.info("✅ Step 5: Validating narrative...")
@@ -107,18 +140,18 @@ async def run_sar_workflow(case_id: str, customer_id: str, db) -> Dict:
 
     # === STEP 6: Save Results ===
     logger.info("💾 Step 6: Saving results...")
-    state = _save_results(state, db, audit_logger)
-    if state["error"]:
-        raise Exception(state["error"])
+    state = await asyncio.to_thread(_save_results, state, db, audit_logger)
+    if state.error:
+        raise Exception(state.error)
 
-    generation_time = int(time.time() - start_time)
-    logger.info(f"🏁 Workflow complete in {generation_time}s")
+    elapsed = time.perf_counter() - state.started_at
+    logger.info(f"🏁 Workflow complete in {elapsed:.1f}s")
 
     return {
-        "narrative_id": state["narrative_id"],
-        "narrative": state["narrative"],
-        "risk_score": state["risk_score"],
-        "typologies": state["typologies"],
+        "narrative_id": state.narrative_id,
+        "narrative": state.narrative,
+        "risk_score": state.risk_score,
+        "typologies": state.typologies,
         "audit_steps": len(audit_logger.logs),
     }
 
@@ -126,33 +159,29 @@ async def run_sar_workflow(case_id: str, customer_id: str, db) -> Dict:
 def _fetch_data(state: SARState, db, audit_logger: AuditLogger) -> SARState:
     """Step 1: Fetch customer and transaction data from database."""
     try:
-        from app.models.customer import Customer
-        from app.models.transaction import Transaction
-
-        customer = (
-            db.query(Customer)
-            .filter(Customer.customer_id == state["customer_id"])
-            .first()
-        )
-
-        if not customer:
-            state["error"] = f"Customer {state['customer_id']} not found"
+        # One round-trip: the customer outer-joined to its transactions, with
+        # the transactions as plain column rows (no ORM instances)
+        rows = db.execute(
+            select(Customer, *Transaction.__table__.columns)
+            .outerjoin(Transaction, Transaction.customer_id == Customer.customer_id)
+            .where(Customer.customer_id == state.customer_id)
+        ).all()
+
+        if not rows:
+            state.error = f"Customer {state.customer_id} not found"
             return state
 
-        state["customer_data"] = customer.to_dict()
+        customer = rows[0][0]
+        state.customer_data = customer.to_dict()
+        transactions = [row for row in rows if row.transaction_id is not None]
 
-        transactions = (
-            db.query(Transaction)
-            .filter(Transaction.customer_id == state["customer_id"])
-            .all()
-        )
-
-        state["transactions"] = [t.to_dict() for t in transactions]
+        state.transactions = [Transaction.to_dict(t) for t in transactions]
+        state.transactions_df = _transactions_frame(transactions)
 
         audit_logger.log_step(
             step_name="fetch_data",
             data_sources={
-                "customer_id": state["customer_id"],
+                "customer_id": state.customer_id,
                 "database": "supabase_postgresql",
             },
             reasoning={
@@ -160,36 +189,55 @@ def _fetch_data(state: SARState, db, audit_logger: AuditLogger) -> SARState:
                 "customer_name": customer.name,
             },
             outputs={
-                "transaction_count": len(state["transactions"]),
+                "transaction_count": len(state.transactions),
                 "customer_found": True,
             },
             confidence=1.0,
         )
 
     except Exception as e:
-        state["error"] = f"Data fetch failed: {str(e)}"
-        logger.error(f"❌ {state['error']}")
+        state.error = f"Data fetch failed: {str(e)}"
+        logger.error(f"❌ {state.error}")
 
     return state
 
 
+def _transactions_frame(transactions: List) -> pd.DataFrame:
+    """Columnar view of the transaction rows for downstream analysis.
+
+    Columns are built directly from the result rows with fixed dtypes, so pandas
+    never has to scan a list of dicts to infer them.
+    """
+    if not transactions:
+        return pd.DataFrame()
+
+    columns = {
+        name: pd.array([getattr(t, name) for t in transactions], dtype="string")
+        for name in _TRANSACTION_STRING_COLUMNS
+    }
+    columns["amount"] = np.fromiter(
+        (t.amount for t in transactions), dtype=np.float64, count=len(transactions)
+    )
+    columns["date"] = pd.to_datetime([t.date for t in transactions])
+    return pd.DataFrame(columns, copy=False)
+
+
 def _analyze_patterns(state: SARState, audit_logger: AuditLogger) -> SARState:
     """Step 2: Detect suspicious patterns using ML."""
     try:
-        df = pd.DataFrame(state["transactions"])
-        patterns = pattern_detector.analyze(df)
+        patterns = pattern_detector.analyze(state.transactions_df)
 
-        state["patterns"] = patterns
-        state["typologies"] = patterns["typologies"]
-        state["risk_score"] = patterns["risk_score"]
+        state.patterns = patterns
+        state.typologies = patterns["typologies"]
+        state.risk_score = patterns["risk_score"]
 
         audit_logger.log_step(
             step_name="analyze_patterns",
             data_sources={
                 "transaction_ids": [
-                    t["transaction_id"][:8] for t in state["transactions"][:10]
+                    t["transaction_id"][:8] for t in islice(state.transactions, 10)
                 ],
-                "total_transactions": len(state["transactions"]),
+                "total_transactions": len(state.transactions),
             },
             reasoning={
                 "velocity": patterns["velocity"],
@@ -198,13 +246,7 @@ def _analyze_patterns(state: SARState, audit_logger: AuditLogger) -> SARState:
                     "unique_sources": patterns["network"]["unique_sources"],
                     "unique_destinations": patterns["network"]["unique_destinations"],
                 },
-                "detection_algorithms": [
-                    "velocity_analysis",
-                    "volume_analysis",
-                    "structuring_detection",
-                    "network_graph_analysis",
-                    "typology_matching",
-                ],
+                "detection_algorithms": _DETECTION_ALGORITHMS,
             },
             outputs={
                 "typologies": patterns["typologies"],
@@ -214,8 +256,8 @@ def _analyze_patterns(state: SARState, audit_logger: AuditLogger) -> SARState:
         )
 
     except Exception as e:
-        state["error"] = f"Pattern analysis failed: {str(e)}"
-        logger.error(f"❌ {state['error']}")
+        state.error = f"Pattern analysis failed: {str(e)}"
+        logger.error(f"❌ {state.error}")
 
     return state
 
@@ -223,30 +265,29 @@ def _analyze_patterns(state: SARState, audit_logger: AuditLogger) -> SARState:
 def _retrieve_templates(state: SARState, audit_logger: AuditLogger) -> SARState:
     """Step 3: Retrieve relevant SAR templates via RAG."""
     try:
-        retrieved = rag_service.retrieve_templates(state["typologies"], top_k=3)
-        state["templates"] = [r["template"] for r in retrieved]
+        retrieved = rag_service.retrieve_templates(state.typologies, top_k=3)
+        state.templates = [r["template"] for r in retrieved]
 
         audit_logger.log_step(
             step_name="retrieve_templates",
             data_sources={
-                "typologies": state["typologies"],
-                "vector_store": "chromadb",
-                "embedding_model": "all-MiniLM-L6-v2",
+                "typologies": state.typologies,
+                **_RAG_SOURCES,
             },
             reasoning={
-                "query": f"SAR templates for {', '.join(state['typologies'])}",
-                "templates_found": len(state["templates"]),
+                "query": f"SAR templates for {', '.join(state.typologies)}",
+                "templates_found": len(state.templates),
                 "sources": [r.get("source", "unknown") for r in retrieved],
             },
             outputs={
-                "templates_retrieved": len(state["templates"]),
+                "templates_retrieved": len(state.templates),
             },
             confidence=0.88,
         )
 
     except Exception as e:
         logger.warning(f"Template retrieval failed: {e}, using defaults")
-        state["templates"] = []
+        state.templates = []
 
     return state
 
@@ -255,23 +296,23 @@ async def _generate_narrative(state: SARState, audit_logger: AuditLogger) -> SAR
     """Step 4: Generate SAR narrative with LLM."""
     try:
         prompt = llm_service.create_sar_prompt(
-            customer_data=state["customer_data"],
-            transactions=state["transactions"],
-            patterns=state["patterns"],
-            templates=state["templates"],
-            typologies=state["typologies"],
+            customer_data=state.customer_data,
+            transactions=state.transactions,
+            patterns=state.patterns,
+            templates=state.templates,
+            typologies=state.typologies,
         )
 
         narrative = await llm_service.generate_narrative(prompt)
-        state["narrative"] = narrative
+        state.narrative = narrative
 
         audit_logger.log_step(
             step_name="generate_narrative",
             data_sources={
                 "llm_model": settings.ollama_model,
                 "prompt_length_chars": len(prompt),
-                "templates_used": len(state["templates"]),
-                "typologies": state["typologies"],
+                "templates_used": len(state.templates),
+                "typologies": state.typologies,
             },
             reasoning={
                 "generation_method": "grounded_prompt_with_rag",
@@ -286,8 +327,8 @@ async def _generate_narrative(state: SARState, audit_logger: AuditLogger) -> SAR
         )
 
     except Exception as e:
-        state["error"] = f"Narrative generation failed: {str(e)}"
-        logger.error(f"❌ {state['error']}")
+        state.error = f"Narrative generation failed: {str(e)}"
+        logger.error(f"❌ {state.error}")
 
     return state
 
@@ -296,20 +337,20 @@ def _validate(state: SARState, audit_logger: AuditLogger) -> SARState:
     """Step 5: Validate narrative for hallucinations."""
     try:
         validation = validator.validate(
-            narrative=state["narrative"],
-            transactions=state["transactions"],
-            customer=state["customer_data"],
+            narrative=state.narrative,
+            transactions=state.transactions,
+            customer=state.customer_data,
         )
 
         llm_validation = llm_service.validate_narrative(
-            narrative=state["narrative"],
-            source_data={"transactions": state["transactions"]},
+            narrative=state.narrative,
+            source_data={"transactions": state.transactions},
         )
 
         audit_logger.log_step(
             step_name="validate_narrative",
             data_sources={
-                "narrative_length": len(state["narrative"]),
+                "narrative_length": len(state.narrative),
                 "validation_checks": ["structure", "hallucination", "completeness"],
             },
             reasoning={
@@ -337,13 +378,9 @@ def _validate(state: SARState, audit_logger: AuditLogger) -> SARState:
 def _save_results(state: SARState, db, audit_logger: AuditLogger) -> SARState:
     """Step 6: Save narrative and audit trail to database."""
     try:
-        from app.models.sar_narrative import SARNarrative
-        from app.models.sar_case import SARCase
-        from app.models.audit_trail import AuditTrail as AuditTrailModel
-
         # Create sentence attribution
         attribution = audit_logger.create_sentence_attribution(
-            state["narrative"], state["transactions"]
+            state.narrative, state.transactions
         )
 
         # Log the save step with attribution
@@ -367,43 +404,55 @@ def _save_results(state: SARState, db, audit_logger: AuditLogger) -> SARState:
 
         # Save narrative
         narrative_record = SARNarrative(
-            case_id=state["case_id"],
-            narrative_text=state["narrative"],
-            generation_time_seconds=0,
+            case_id=state.case_id,
+            narrative_text=state.narrative,
+            generation_time_seconds=int(time.perf_counter() - state.started_at),
         )
         db.add(narrative_record)
         db.flush()
 
-        state["narrative_id"] = str(narrative_record.narrative_id)
+        state.narrative_id = str(narrative_record.narrative_id)
 
         # Update case with risk score and typologies
-        case = db.query(SARCase).filter(SARCase.case_id == state["case_id"]).first()
-        if case:
-            case.risk_score = state["risk_score"]
-            case.typologies = state["typologies"]
-            case.status = "generated"
-
-        # Save audit logs
-        for log in audit_logger.logs:
-            audit_record = AuditTrailModel(
-                narrative_id=narrative_record.narrative_id,
-                step_name=log["step_name"],
-                data_sources=log["data_sources"],
-                reasoning=log["reasoning"],
-                confidence_scores=log["confidence_scores"],
-                previous_hash=log["previous_hash"],
-                current_hash=log["current_hash"],
+        db.execute(
+            update(SARCase)
+            .where(SARCase.case_id == state.case_id)
+            .values(
+                risk_score=state.risk_score,
+                typologies=state.typologies,
+                status="generated",
             )
-            db.add(audit_record)
+        )
+
+        # Save audit logs as one executemany INSERT
+        db.execute(
+            insert(AuditTrailModel),
+            [
+                {
+                    "narrative_id": narrative_record.narrative_id,
+                    "step_name": log["step_name"],
+                    "data_sources": log["data_sources"],
+                    "reasoning": log["reasoning"],
+                    "confidence_scores": log["confidence_scores"],
+                    # Store the hashed timestamp so rows sort in chain order
+                    "logged_at": datetime.fromisoformat(log["logged_at"]).replace(
+                        tzinfo=None
+                    ),
+                    "previous_hash": log["previous_hash"],
+                    "current_hash": log["current_hash"],
+                }
+                for log in audit_logger.logs
+            ],
+        )
 
         db.commit()
         logger.info(
-            f"💾 Saved narrative {state['narrative_id']} with {len(audit_logger.logs)} audit entries"
+            f"💾 Saved narrative {state.narrative_id} with {len(audit_logger.logs)} audit entries"
         )
 
     except Exception as e:
         db.rollback()
-        state["error"] = f"Database save failed: {str(e)}"
-        logger.error(f"❌ {state['error']}")
+        state.error = f"Database save failed: {str(e)}"
+        logger.error(f"❌ {state.error}")
 
     return state
@@ -4,17 +4,51 @@ Uses llama3.2:latest running locally via Ollama for privacy-preserving,
 on-premise text generation with no data leaving the institution.
 """
 
+import asyncio
+import heapq
 import httpx
-import json
+import numpy as np
+import orjson
 from typing import Dict, List
 from app.config import get_settings
 from app.utils.prompts import SAR_GENERATION_PROMPT
 import logging
 import re
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:
+    h2 = None
+
 logger = logging.getLogger("luminasar.llm")
 settings = get_settings()
 
+_CURRENCY_SYMBOL = "₹"
+_AMOUNT_RE = re.compile(_CURRENCY_SYMBOL + r"[\d,]+(?:\.\d+)?")
+# Drops digit-group separators from a matched amount in one pass
+_STRIP_TABLE = str.maketrans("", "", ", \t")
+
+
+def _select_prompt_transactions(transactions: List[dict], limit: int) -> List[dict]:
+    """Pick the ``limit`` largest transactions, keeping their original order."""
+    if len(transactions) <= limit:
+        return transactions
+    largest = heapq.nlargest(
+        limit,
+        range(len(transactions)),
+        key=lambda i: float(transactions[i].get("amount") or 0),
+    )
+    return [transactions[i] for i in sorted(largest)]
+
+
+def _format_transaction(t: dict) -> str:
+    """One prompt line describing a transaction."""
+    return (
+        f"  - ₹{float(t.get('amount', 0)):,.2f} on {t.get('date', 'N/A')} "
+        f"from {t.get('source_account', 'N/A')} to {t.get('destination_account', 'N/A')} "
+        f"({t.get('transaction_type', 'unknown')})"
+    )
+
 
 class LLMService:
     """Interfaces with Ollama to generate SAR narratives."""
@@ -26,6 +60,39 @@ class LLMService:
     ):
         self.model = model or settings.ollama_model
         self.base_url = base_url or settings.ollama_host
+        self._client = None
+        self._client_loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for Ollama, created on first use.
+
+        A client's connections belong to the event loop that opened them, so
+        a new one is created if the service is used from a different loop.
+        When ``h2`` is installed, HTTP/2 is negotiated over TLS (e.g. Ollama
+        behind a reverse proxy) so concurrent generations share one
+        connection; plain ``http://`` hosts keep using HTTP/1.1 keep-alive.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=120.0,
+                http2=h2 is not None,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the shared Ollama client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
 
     def create_sar_prompt(
         self,
@@ -40,20 +107,15 @@ class LLMService:
         All data is embedded in the prompt to ground the LLM's output
         and prevent hallucination.
         """
-        # Format transactions for prompt (limit to 25 to avoid token overflow)
-        transaction_lines = []
-        for t in transactions[:25]:
-            line = (
-                f"  - ₹{float(t.get('amount', 0)):,.2f} on {t.get('date', 'N/A')} "
-                f"from {t.get('source_account', 'N/A')} to {t.get('destination_account', 'N/A')} "
-                f"({t.get('transaction_type', 'unknown')})"
-            )
-            transaction_lines.append(line)
-
-        transactions_text = "\n".join(transaction_lines)
-        if len(transactions) > 25:
+        # Format transactions for prompt (capped to avoid token overflow; the
+        # largest amounts are the most material to the narrative)
+        limit = settings.llm_prompt_transactions
+        transactions_text = "\n".join(
+            map(_format_transaction, _select_prompt_transactions(transactions, limit))
+        )
+        if len(transactions) > limit:
             transactions_text += (
-                f"\n  ... and {len(transactions) - 25} more transactions"
+                f"\n  ... and {len(transactions) - limit} more transactions"
             )
 
         # Format templates
@@ -102,29 +164,14 @@ class LLMService:
             Generated narrative text
         """
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.3,
-                            "num_predict": 2000,
-                            "top_p": 0.9,
-                        },
-                    },
-                )
-                response.raise_for_status()
-                result = response.json()
-                narrative = result.get("response", "").strip()
+            chunks = [chunk async for chunk in self.generate_narrative_stream(prompt)]
+            narrative = "".join(chunks).strip()
 
-                if not narrative:
-                    raise Exception("Empty response from LLM")
+            if not narrative:
+                raise Exception("Empty response from LLM")
 
-                logger.info(f"✅ Generated narrative: {len(narrative)} chars")
-                return narrative
+            logger.info(f"✅ Generated narrative: {len(narrative)} chars")
+            return narrative
 
         except httpx.ConnectError:
             logger.error(f"❌ Cannot connect to Ollama at {self.base_url}")
@@ -134,11 +181,56 @@ class LLMService:
             )
         except httpx.TimeoutException:
             logger.error("❌ Ollama request timed out")
-            raise Exception("LLM generation timed out (>120s)")
+            raise Exception("Ollama stopped responding (no output for 120s)")
         except Exception as e:
             logger.error(f"❌ LLM generation failed: {e}")
             raise
 
+    async def generate_narrative_stream(self, prompt: str):
+        """Stream SAR narrative text from Ollama as it is generated.
+
+        Ollama streams NDJSON objects whose ``response`` field holds the next
+        piece of text, so callers can consume output before generation ends
+        and the timeout applies between chunks rather than to the whole run.
+        A failure after streaming has started arrives as an ``error`` object,
+        which is raised rather than ending the stream early.
+
+        Args:
+            prompt: The fully constructed prompt
+
+        Yields:
+            Narrative text chunks in generation order
+        """
+        body = orjson.dumps(
+            {
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True,
+                "options": {
+                    "temperature": 0.3,
+                    "num_predict": 2000,
+                    "top_p": 0.9,
+                },
+            }
+        )
+        async with self._get_client().stream(
+            "POST",
+            "/api/generate",
+            content=body,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = orjson.loads(line)
+                if chunk.get("error"):
+                    raise Exception(f"Ollama error: {chunk['error']}")
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+
     def validate_narrative(self, narrative: str, source_data: dict) -> dict:
         """Check for hallucinated amounts and dates.
 
@@ -155,30 +247,48 @@ class LLMService:
             "warnings": [],
         }
 
-        # Extract amounts from narrative (₹X,XX,XXX format)
-        amount_pattern = r"₹[\d,]+(?:\.\d+)?"
-        amounts_in_narrative = re.findall(amount_pattern, narrative)
+        # Cheap substring check skips the regex when no amount can be present
+        if _CURRENCY_SYMBOL not in narrative:
+            return validation_result
 
-        # Extract source transaction amounts for comparison
-        source_amounts = set()
-        transactions = source_data.get("transactions", [])
-        total = sum(float(t.get("amount", 0)) for t in transactions)
-        source_amounts.add(round(total, 2))
-        for t in transactions:
-            source_amounts.add(round(float(t.get("amount", 0)), 2))
+        # Extract amounts from narrative (₹X,XX,XXX format)
+        amounts_in_narrative = _AMOUNT_RE.findall(narrative)
 
-        # Check narrative amounts against source
+        # Parse narrative amounts, keeping their order for the warnings
+        parsed = []
         for amount_str in amounts_in_narrative:
-            clean = amount_str.replace("₹", "").replace(",", "")
             try:
-                amount_val = float(clean)
-                # Allow some tolerance for rounding
-                matched = any(abs(amount_val - src) < 1.0 for src in source_amounts)
-                if not matched and amount_val > 1000:
-                    validation_result["warnings"].append(
-                        f"Amount {amount_str} not found in source data"
-                    )
+                digits = amount_str.removeprefix(_CURRENCY_SYMBOL)
+                parsed.append((amount_str, float(digits.translate(_STRIP_TABLE))))
             except ValueError:
                 pass
 
+        if not parsed:
+            return validation_result
+
+        # Sorted source amounts (each transaction plus the total), so every
+        # narrative amount is matched by binary search instead of a full scan
+        transactions = source_data.get("transactions", [])
+        amounts = np.fromiter(
+            (float(t.get("amount", 0)) for t in transactions),
+            dtype=np.float64,
+            count=len(transactions),
+        )
+        source_amounts = np.unique(np.round(np.append(amounts, amounts.sum()), 2))
+
+        # Distance to the nearest source amount (allow some tolerance for
+        # rounding)
+        values = np.array([value for _, value in parsed])
+        idx = np.searchsorted(source_amounts, values)
+        above = source_amounts[np.minimum(idx, len(source_amounts) - 1)]
+        below = source_amounts[np.maximum(idx - 1, 0)]
+        nearest = np.minimum(np.abs(above - values), np.abs(below - values))
+        unmatched = (nearest >= 1.0) & (values > 1000)
+
+        for (amount_str, _), flag in zip(parsed, unmatched):
+            if flag:
+                validation_result["warnings"].append(
+                    f"Amount {amount_str} not found in source data"
+                )
+
         return validation_result
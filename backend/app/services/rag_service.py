@@ -5,11 +5,26 @@ for context-aware narrative generation.
 """
 
 import chromadb
+from cachetools import LRUCache, TTLCache
+from app.config import get_settings
 from typing import List, Dict
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger("luminasar.rag_service")
+settings = get_settings()
+
+# HNSW parameters sized for a corpus of a few dozen templates. Chroma only
+# applies these when the collection is created; delete the persisted
+# collection to change them.
+_HNSW_SETTINGS = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 8,
+    "hnsw:construction_ef": 40,
+    "hnsw:search_ef": 16,
+}
 
 
 class RAGService:
@@ -20,38 +35,105 @@ class RAGService:
         self._client = None
         self._collection = None
         self._embedding_fn = None
+        # Collection size, read once; templates only change via load_templates
+        self._template_count = None
+        # Retrieval is a pure function of (typologies, top_k) until templates
+        # are reloaded, and typology combinations repeat across cases
+        self._retrieval_cache = TTLCache(maxsize=256, ttl=3600)
+        # Query embeddings depend only on the text, so unlike retrieval
+        # results they stay valid across template reloads
+        self._embedding_cache = LRUCache(maxsize=1024)
+        self._cache_lock = threading.Lock()
+        # Serializes the lazy client/collection/model setup, which runs in
+        # worker threads; kept apart from _cache_lock so cache lookups never
+        # wait behind a model load
+        self._init_lock = threading.Lock()
 
     def _get_client(self):
         """Lazy-initialize ChromaDB client."""
         if self._client is None:
-            self._client = chromadb.PersistentClient(path=self.persist_directory)
+            with self._init_lock:
+                if self._client is None:
+                    self._client = chromadb.PersistentClient(
+                        path=self.persist_directory
+                    )
         return self._client
 
     def _get_collection(self):
         """Lazy-initialize collection."""
         if self._collection is None:
             client = self._get_client()
-            self._collection = client.get_or_create_collection(
-                name="sar_templates",
-                metadata={"description": "SAR templates and regulatory guidelines"},
-            )
+            with self._init_lock:
+                if self._collection is None:
+                    self._collection = client.get_or_create_collection(
+                        name="sar_templates",
+                        metadata={
+                            "description": "SAR templates and regulatory guidelines",
+                            **_HNSW_SETTINGS,
+                        },
+                    )
         return self._collection
 
+    def _get_template_count(self) -> int:
+        """Number of stored templates, cached to avoid a Chroma round-trip.
+
+        An empty count is not cached, so templates loaded into the persistent
+        store by another process are still picked up.
+        """
+        if self._template_count is None:
+            count = self._get_collection().count()
+            if count == 0:
+                return 0
+            self._template_count = count
+        return self._template_count
+
     def _get_embedding_fn(self):
         """Lazy-initialize sentence transformer."""
         if self._embedding_fn is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-
-                self._embedding_fn = SentenceTransformer("all-MiniLM-L6-v2")
-                logger.info("✅ Loaded sentence-transformers (all-MiniLM-L6-v2)")
-            except ImportError:
-                logger.warning(
-                    "⚠️ sentence-transformers not installed, using basic embeddings"
-                )
-                self._embedding_fn = None
+            with self._init_lock:
+                if self._embedding_fn is None:
+                    self._embedding_fn = _load_embedding_model()
         return self._embedding_fn
 
+    def _encode_query(self, embedding_model, query_text: str) -> List[float]:
+        """Embed a query string, reusing the vector for repeated queries.
+
+        Args:
+            embedding_model: Loaded sentence-transformers model
+            query_text: Query to embed
+
+        Returns:
+            Query embedding as a list of floats
+        """
+        # Long free-text queries rarely repeat; keep them out of the cache
+        cacheable = len(query_text) <= 512
+        if cacheable:
+            with self._cache_lock:
+                cached = self._embedding_cache.get(query_text)
+            if cached is not None:
+                return cached
+
+        embedding = embedding_model.encode(
+            query_text, show_progress_bar=False
+        ).tolist()
+        if cacheable:
+            with self._cache_lock:
+                self._embedding_cache[query_text] = embedding
+        return embedding
+
+    def warm_up(self):
+        """Initialize the vector store and embedding model ahead of a query.
+
+        Safe to call from several threads at once: each resource is created
+        once under the init lock. Failures are logged and left for
+        retrieve_templates to fall back on.
+        """
+        try:
+            self._get_collection()
+            self._get_embedding_fn()
+        except Exception as e:
+            logger.warning(f"RAG warm-up failed: {e}")
+
     def load_templates(self, templates_dir: str) -> int:
         """Load SAR templates from text files into ChromaDB.
 
@@ -72,35 +154,37 @@ class RAGService:
         metadatas = []
         ids = []
 
-        for i, file_path in enumerate(templates_path.glob("*.txt")):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if not content:
-                        continue
+        # Reads are I/O bound and release the GIL; map keeps glob order
+        files = list(templates_path.glob("*.txt"))
+        with ThreadPoolExecutor(max_workers=min(16, len(files) or 1)) as pool:
+            contents = list(pool.map(_read_template, files))
 
-                    documents.append(content)
+        for i, (file_path, content) in enumerate(zip(files, contents)):
+            if not content:
+                continue
 
-                    # Extract typology from filename
-                    parts = file_path.stem.split("_")
-                    typology = parts[1] if len(parts) > 1 else "general"
+            documents.append(content)
 
-                    metadatas.append(
-                        {
-                            "typology": typology,
-                            "source": file_path.name,
-                        }
-                    )
-                    ids.append(f"template_{i}")
-            except Exception as e:
-                logger.warning(f"Failed to load {file_path}: {e}")
+            # Extract typology from filename
+            parts = file_path.stem.split("_")
+            typology = parts[1] if len(parts) > 1 else "general"
+
+            metadatas.append(
+                {
+                    "typology": typology,
+                    "source": file_path.name,
+                }
+            )
+            ids.append(f"template_{i}")
 
         if documents:
             collection = self._get_collection()
             embedding_model = self._get_embedding_fn()
 
             if embedding_model:
-                embeddings = embedding_model.encode(documents).tolist()
+                embeddings = embedding_model.encode(
+                    documents, batch_size=64, show_progress_bar=False
+                ).tolist()
                 collection.upsert(
                     documents=documents,
                     embeddings=embeddings,
@@ -114,6 +198,9 @@ class RAGService:
                     ids=ids,
                 )
 
+            self._template_count = collection.count()
+            with self._cache_lock:
+                self._retrieval_cache.clear()
             logger.info(f"✅ Loaded {len(documents)} templates into ChromaDB")
 
         return len(documents)
@@ -128,10 +215,17 @@ class RAGService:
         Returns:
             List of dictionaries containing template text and metadata
         """
+        cache_key = (tuple(typologies), top_k)
+        with self._cache_lock:
+            cached = self._retrieval_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             collection = self._get_collection()
+            count = self._get_template_count()
 
-            if collection.count() == 0:
+            if count == 0:
                 logger.warning(
                     "ChromaDB collection is empty, returning default template"
                 )
@@ -141,15 +235,15 @@ class RAGService:
             embedding_model = self._get_embedding_fn()
 
             if embedding_model:
-                query_embedding = embedding_model.encode([query_text]).tolist()
+                query_embedding = [self._encode_query(embedding_model, query_text)]
                 results = collection.query(
                     query_embeddings=query_embedding,
-                    n_results=min(top_k, collection.count()),
+                    n_results=min(top_k, count),
                 )
             else:
                 results = collection.query(
                     query_texts=[query_text],
-                    n_results=min(top_k, collection.count()),
+                    n_results=min(top_k, count),
                 )
 
             retrieved = []
@@ -175,7 +269,12 @@ class RAGService:
                             }
                         )
 
-            return retrieved if retrieved else [self._get_default_template()]
+            if not retrieved:
+                return [self._get_default_template()]
+
+            with self._cache_lock:
+                self._retrieval_cache[cache_key] = tuple(retrieved)
+            return retrieved
 
         except Exception as e:
             logger.error(f"Template retrieval failed: {e}")
@@ -203,3 +302,35 @@ Based on the evidence gathered, the activity warrants filing a Suspicious Activi
             "source": "default_template",
             "distance": None,
         }
+
+
+def _load_embedding_model():
+    """Load the sentence transformer (None if it is not installed)."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning("⚠️ sentence-transformers not installed, using basic embeddings")
+        return None
+
+    backend = settings.embedding_backend
+    # Only pass a non-default backend, so older releases without the argument
+    # keep working
+    kwargs = {"backend": backend} if backend != "torch" else {}
+    model = SentenceTransformer("all-MiniLM-L6-v2", **kwargs)
+    # A torch model picks CUDA on its own when available; fp16 halves the
+    # memory traffic of each forward pass there
+    if backend == "torch":
+        if model.device.type == "cuda":
+            model.half()
+        backend = f"torch, {model.device}"
+    logger.info(f"✅ Loaded sentence-transformers (all-MiniLM-L6-v2, {backend})")
+    return model
+
+
+def _read_template(file_path) -> str:
+    """Read and strip one template file ("" if it cannot be read)."""
+    try:
+        return file_path.read_text(encoding="utf-8").strip()
+    except Exception as e:
+        logger.warning(f"Failed to load {file_path}: {e}")
+        return ""
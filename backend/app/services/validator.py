@@ -10,6 +10,11 @@ import logging
 
 logger = logging.getLogger("luminasar.validator")
 
+_GENERIC_PHRASES = ("I cannot", "I'm sorry", "As an AI")
+# (phrase, lowercased phrase) pairs, lowered once at import
+_GENERIC_PHRASES_LOWER = tuple((p, p.lower()) for p in _GENERIC_PHRASES)
+_REQUIRED_SECTIONS = ("activity", "transaction", "suspicious")
+
 
 class NarrativeValidator:
     """Validates generated SAR narratives against source data."""
@@ -48,17 +53,15 @@ class NarrativeValidator:
         if word_count < 100:
             errors.append(f"Narrative too short ({word_count} words, minimum 100)")
 
-        # 4. Check narrative isn't empty or generic
-        generic_phrases = ["I cannot", "I'm sorry", "As an AI"]
-        for phrase in generic_phrases:
-            if phrase.lower() in narrative.lower():
+        # 4. Check narrative isn't empty or generic (lowercase the text once
+        # for all case-insensitive checks)
+        narrative_lower = narrative.lower()
+        for phrase, phrase_lower in _GENERIC_PHRASES_LOWER:
+            if phrase_lower in narrative_lower:
                 errors.append(f"Narrative contains generic AI response: '{phrase}'")
 
         # 5. Check for SAR structure keywords
-        required_sections = ["activity", "transaction", "suspicious"]
-        found_sections = sum(
-            1 for s in required_sections if s.lower() in narrative.lower()
-        )
+        found_sections = sum(s in narrative_lower for s in _REQUIRED_SECTIONS)
         if found_sections < 2:
             warnings.append("Narrative may be missing key SAR sections")
 
@@ -1,27 +1,42 @@
 """Hash chain utilities for tamper-evident audit trail."""
 
 import hashlib
-import json
 from typing import Dict
 
+import orjson
 
-def compute_hash(data: Dict, exclude_keys: list = None) -> str:
-    """Compute SHA-256 hash of a dictionary.
+_CANONICAL_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+)
+
+
+def canonical_json(data) -> bytes:
+    """Deterministic (sorted-key) JSON encoding used for hashing."""
+    return orjson.dumps(data, option=_CANONICAL_OPTIONS, default=str)
+
+
+def chain_digest(previous_digest: bytes, payload: Dict) -> bytes:
+    """Compute the next link of a SHA-256 hash chain as raw bytes.
+
+    ``H_i = SHA-256(H_{i-1} || canonical_json(payload_i))``. The previous
+    digest is fed as raw bytes rather than re-serialized inside the payload.
 
     Args:
-        data: Dictionary to hash
-        exclude_keys: Keys to exclude from hash computation
+        previous_digest: Raw digest of the previous link
+        payload: Entry fields to hash (must not contain the hashes)
 
     Returns:
-        SHA-256 hex digest string
+        32-byte SHA-256 digest
     """
-    data_copy = data.copy()
-    for key in exclude_keys or []:
-        data_copy.pop(key, None)
+    digest = hashlib.sha256(previous_digest)
+    digest.update(canonical_json(payload))
+    return digest.digest()
+
 
-    # Create deterministic string representation
-    data_string = json.dumps(data_copy, sort_keys=True, default=str)
-    return hashlib.sha256(data_string.encode()).hexdigest()
+def compute_chain_hash(previous_hash: str, payload: Dict) -> str:
+    """Hex form of :func:`chain_digest` for a hex-encoded previous hash."""
+    return chain_digest(bytes.fromhex(previous_hash), payload).hex()
 
 
 GENESIS_HASH = "0" * 64
+GENESIS_HASH_BYTES = bytes.fromhex(GENESIS_HASH)
@@ -1,4 +1,9 @@
-"""LLM Prompt Templates for SAR generation."""
+"""LLM Prompt Templates for SAR generation.
+
+SAR_GENERATION_PROMPT keeps the case-independent text (instructions, then
+the retrieved reference templates) ahead of the per-case data, so Ollama can
+reuse the cached prompt prefix across cases instead of re-processing it.
+"""
 
 SAR_GENERATION_PROMPT = """You are a senior bank compliance analyst writing a Suspicious Activity Report (SAR) for regulatory submission to the Financial Intelligence Unit (FIU-IND).
 
@@ -9,6 +14,9 @@ SAR_GENERATION_PROMPT = """You are a senior bank compliance analyst writing a Su
 - Cite specific transaction details when describing activity.
 - Write in formal regulatory language.
 
+**REFERENCE TEMPLATES (format guidance only, not case data):**
+{templates_text}
+
 **CUSTOMER INFORMATION:**
 Name: {customer_name}
 Account Number: {account_number}
@@ -30,9 +38,6 @@ Stated Income: ₹{stated_income}
 - Structuring Likelihood: {structuring_likelihood}
 - Near-Threshold Transactions: {near_threshold_count}
 
-**REFERENCE TEMPLATES:**
-{templates_text}
-
 **YOUR TASK:**
 Write a complete SAR narrative (3-4 paragraphs, 400-600 words) with these sections:
 
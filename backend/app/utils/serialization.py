@@ -0,0 +1,48 @@
+"""Fast ORM row → dict serialization helpers."""
+
+from operator import attrgetter
+from typing import Callable
+
+
+def optional(fn: Callable) -> Callable:
+    """Apply ``fn`` to truthy values, map falsy values to None."""
+    return lambda value: fn(value) if value else None
+
+
+def or_empty_dict(value):
+    """Replace a falsy JSON column value with an empty dict."""
+    return value or {}
+
+
+def or_empty_list(value):
+    """Replace a falsy JSON column value with an empty list."""
+    return value or []
+
+
+isoformat = optional(lambda value: value.isoformat())
+
+
+def make_to_dict(*fields) -> Callable:
+    """Build a ``to_dict`` method for a fixed set of model fields.
+
+    Each field is either an attribute name or a ``(name, converter)`` tuple.
+    The attribute getter and converter list are resolved once per class
+    instead of on every call.
+
+    Args:
+        fields: Field names, optionally paired with a converter
+
+    Returns:
+        Function suitable for use as a model's ``to_dict`` method
+    """
+    names = tuple(f if isinstance(f, str) else f[0] for f in fields)
+    converters = tuple(None if isinstance(f, str) else f[1] for f in fields)
+    getter = attrgetter(*names)
+
+    def to_dict(self) -> dict:
+        return {
+            name: value if convert is None else convert(value)
+            for name, convert, value in zip(names, converters, getter(self))
+        }
+
+    return to_dict
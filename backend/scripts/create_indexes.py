@@ -0,0 +1,49 @@
+"""Create the model indexes on an existing database.
+
+create_all only builds indexes for tables it creates, so a Supabase
+PostgreSQL database (or a luminasar.db from an older version) does not get
+indexes added to the models later. This creates any that are missing and
+drops the ones since found redundant. Safe to re-run.
+
+Run: python -m scripts.create_indexes
+"""
+
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex
+
+from app.database import Base, get_engine
+import app.models  # noqa: F401  (registers the tables on Base.metadata)
+
+# Superseded indexes: account_number's unique constraint already has an
+# index, and ix_audit_narr_logged leads with narrative_id
+REDUNDANT_INDEXES = ("ix_customers_account_number", "ix_audit_trail_narrative_id")
+
+
+def main():
+    engine = get_engine()
+    print(f"🗄️ Indexing {engine.url.render_as_string(hide_password=True)}")
+
+    with engine.begin() as conn:
+        for name in REDUNDANT_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"   🗑️ {name} (dropped if present)")
+
+        for table in Base.metadata.sorted_tables:
+            for index in sorted(table.indexes, key=lambda ix: ix.name):
+                if conn.dialect.has_index(conn, table.name, index.name):
+                    print(f"   ✔️ {index.name} exists")
+                    continue
+                conn.execute(CreateIndex(index))
+                print(f"   ✅ {CreateIndex(index).compile(dialect=conn.dialect)}")
+
+    print("✅ Indexes up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Freeze backend/.env into an importable Python module.
+
+Writes app/_env_frozen.py containing the parsed .env values so that
+app.config can populate os.environ without reading and parsing .env on
+every cold start. Re-run after changing .env.
+
+Run: python -m scripts.freeze_env
+"""
+
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+BACKEND_DIR = Path(__file__).parent.parent
+ENV_FILE = BACKEND_DIR / ".env"
+FROZEN_FILE = BACKEND_DIR / "app" / "_env_frozen.py"
+
+
+def main():
+    values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+
+    lines = [
+        '"""Generated by scripts/freeze_env.py — do not edit or commit."""',
+        "",
+        "_FROZEN = {",
+        *(f"    {k!r}: {v!r}," for k, v in sorted(values.items())),
+        "}",
+        "",
+    ]
+    FROZEN_FILE.write_text("\n".join(lines), encoding="utf-8")
+    print(f"✅ Froze {len(values)} variables from {ENV_FILE} into {FROZEN_FILE}")
+
+
+if __name__ == "__main__":
+    main()
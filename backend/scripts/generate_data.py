@@ -10,11 +10,13 @@ Run: python -m scripts.generate_data
 
 import uuid
 import random
-import json
+import orjson
+import numpy as np
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import sys
 import os
+from contextlib import ExitStack
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,13 +34,15 @@ from dotenv import load_dotenv
 
 load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
 
+OUTPUT_DIR = Path(__file__).parent.parent / "data" / "generated"
+
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "") or os.getenv(
     "SUPABASE_ANON_KEY", ""
 )
 
 # Indian names and occupations
-FIRST_NAMES = [
+FIRST_NAMES = (
     "Rajesh",
     "Priya",
     "Amit",
@@ -54,8 +58,8 @@ FIRST_NAMES = [
     "Rohit",
     "Neha",
     "Suresh",
-]
-LAST_NAMES = [
+)
+LAST_NAMES = (
     "Sharma",
     "Patel",
     "Mehta",
@@ -71,8 +75,8 @@ LAST_NAMES = [
     "Pandey",
     "Aggarwal",
     "Shah",
-]
-OCCUPATIONS = [
+)
+OCCUPATIONS = (
     "Business Owner",
     "Software Engineer",
     "Import-Export Dealer",
@@ -83,8 +87,8 @@ OCCUPATIONS = [
     "Pharmaceutical Distributor",
     "Retired Government Official",
     "Self-Employed Consultant",
-]
-BANKS = [
+)
+BANKS = (
     "State Bank of India",
     "HDFC Bank",
     "ICICI Bank",
@@ -93,8 +97,8 @@ BANKS = [
     "Bank of Baroda",
     "Kotak Mahindra Bank",
     "IndusInd Bank",
-]
-CITIES = [
+)
+CITIES = (
     "Mumbai",
     "Delhi",
     "Bangalore",
@@ -103,7 +107,13 @@ CITIES = [
     "Kolkata",
     "Pune",
     "Ahmedabad",
-]
+)
+
+ACCOUNT_PREFIXES = ("SBI", "HDFC", "ICICI", "AXIS")
+STREETS = ("MG Road", "Anna Salai", "Park Street", "FC Road", "Linking Road")
+INCOME_BUCKETS = (300000, 500000, 800000, 1200000, 2000000, 5000000)
+RISK_RATINGS = ("low", "medium", "high")
+TRANSACTION_TYPES = ("wire_transfer", "cash_deposit", "rtgs", "neft", "upi")
 
 TYPOLOGY_CONFIGS = {
     "structuring": {
@@ -133,27 +143,45 @@ TYPOLOGY_CONFIGS = {
 }
 
 
+def _uuid4_strings(block_size: int = 256):
+    """Yield random UUID4 strings, reading entropy for ``block_size`` at once.
+
+    uuid.uuid4() makes one os.urandom call per ID; this amortizes the
+    syscall over a whole block.
+    """
+    while True:
+        entropy = os.urandom(16 * block_size)
+        for offset in range(0, len(entropy), 16):
+            yield str(uuid.UUID(bytes=entropy[offset : offset + 16], version=4))
+
+
+_uuid_pool = _uuid4_strings()
+_rng = np.random.default_rng()
+
+
+def new_uuid() -> str:
+    return next(_uuid_pool)
+
+
 def generate_account_number():
-    return f"{random.choice(['SBI', 'HDFC', 'ICICI', 'AXIS'])}{random.randint(100000000, 999999999)}"
+    return f"{random.choice(ACCOUNT_PREFIXES)}{random.randint(100000000, 999999999)}"
 
 
 def generate_customer():
     first = random.choice(FIRST_NAMES)
     last = random.choice(LAST_NAMES)
     return {
-        "customer_id": str(uuid.uuid4()),
+        "customer_id": new_uuid(),
         "name": f"{first} {last}",
         "account_number": generate_account_number(),
         "occupation": random.choice(OCCUPATIONS),
-        "risk_rating": random.choice(["low", "medium", "high"]),
+        "risk_rating": random.choice(RISK_RATINGS),
         "kyc_status": "verified",
-        "address": f"{random.randint(1, 500)}, {random.choice(['MG Road', 'Anna Salai', 'Park Street', 'FC Road', 'Linking Road'])}, {random.choice(CITIES)}",
-        "stated_income": random.choice(
-            [300000, 500000, 800000, 1200000, 2000000, 5000000]
-        ),
+        "address": f"{random.randint(1, 500)}, {random.choice(STREETS)}, {random.choice(CITIES)}",
+        "stated_income": random.choice(INCOME_BUCKETS),
         "customer_since": (
-            datetime.now() - timedelta(days=random.randint(365, 3650))
-        ).strftime("%Y-%m-%d"),
+            datetime.now().date() - timedelta(days=random.randint(365, 3650))
+        ).isoformat(),
     }
 
 
@@ -161,47 +189,56 @@ def generate_transactions(customer_id, typology="structuring"):
     config = TYPOLOGY_CONFIGS[typology]
     num_txns = random.randint(*config["num_transactions"])
     base_date = datetime.now(timezone.utc) - timedelta(days=random.randint(1, 30))
-    txns = []
 
     external_accounts = [
         generate_account_number() for _ in range(random.randint(3, 15))
     ]
 
-    for i in range(num_txns):
-        amount = round(random.uniform(*config["amount_range"]), 2)
-        date = base_date - timedelta(
-            days=random.randint(0, config["time_span_days"]),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59),
-        )
-
-        is_inbound = random.random() < 0.6  # 60% inbound
+    # Draw every per-transaction random value as an array in one call each
+    amounts = np.round(_rng.uniform(*config["amount_range"], num_txns), 2)
+    offsets = (
+        _rng.integers(0, config["time_span_days"], num_txns, endpoint=True) * 1440
+        + _rng.integers(0, 23, num_txns, endpoint=True) * 60
+        + _rng.integers(0, 59, num_txns, endpoint=True)
+    ).astype("timedelta64[m]")
+    dates = np.datetime_as_string(
+        np.datetime64(base_date.replace(tzinfo=None), "s") - offsets, unit="s"
+    )
+    is_inbound = _rng.random(num_txns) < 0.6  # 60% inbound
+    counterparties = np.array(external_accounts)[
+        _rng.integers(0, len(external_accounts), num_txns)
+    ]
+    types = np.array(TRANSACTION_TYPES)[
+        _rng.integers(0, len(TRANSACTION_TYPES), num_txns)
+    ]
 
-        txn = {
-            "transaction_id": str(uuid.uuid4()),
+    txns = [
+        {
+            "transaction_id": new_uuid(),
             "customer_id": customer_id,
             "amount": amount,
             "currency": "INR",
-            "transaction_type": random.choice(
-                ["wire_transfer", "cash_deposit", "rtgs", "neft", "upi"]
-            ),
-            "source_account": random.choice(external_accounts)
-            if is_inbound
-            else "SELF",
-            "destination_account": "SELF"
-            if is_inbound
-            else random.choice(external_accounts),
-            "date": date.strftime("%Y-%m-%dT%H:%M:%S"),
+            "transaction_type": txn_type,
+            "source_account": counterparty if inbound else "SELF",
+            "destination_account": "SELF" if inbound else counterparty,
+            "date": date,
             "status": "completed",
         }
-        txns.append(txn)
+        for amount, date, inbound, counterparty, txn_type in zip(
+            amounts.tolist(),
+            dates.tolist(),
+            is_inbound.tolist(),
+            counterparties.tolist(),
+            types.tolist(),
+        )
+    ]
 
     return txns
 
 
 def generate_sar_case(customer_id, typologies):
     return {
-        "case_id": str(uuid.uuid4()),
+        "case_id": new_uuid(),
         "customer_id": customer_id,
         "status": "pending",
         "risk_score": None,
@@ -209,6 +246,44 @@ def generate_sar_case(customer_id, typologies):
     }
 
 
+def _write_ndjson(f, records):
+    """Append records to an open binary file, one JSON object per line."""
+    f.write(b"".join(orjson.dumps(r) + b"\n" for r in records))
+
+
+def _customer_row(c):
+    return {
+        "customer_id": c["customer_id"],
+        "name": c["name"],
+        "account_number": c["account_number"],
+        "occupation": c["occupation"],
+        "stated_income": c["stated_income"],
+        "customer_since": datetime.fromisoformat(c["customer_since"]),
+    }
+
+
+def _transaction_row(t):
+    return {
+        "transaction_id": t["transaction_id"],
+        "customer_id": t["customer_id"],
+        "amount": t["amount"],
+        "date": datetime.fromisoformat(t["date"]),
+        "source_account": t["source_account"],
+        "destination_account": t["destination_account"],
+        "transaction_type": t["transaction_type"],
+    }
+
+
+def _case_row(c):
+    return {
+        "case_id": c["case_id"],
+        "customer_id": c["customer_id"],
+        "status": c["status"],
+        "risk_score": c["risk_score"],
+        "typologies": c["typologies"],
+    }
+
+
 def main():
     print("🏗️  LuminaSAR — Generating Synthetic Data")
     print("=" * 50)
@@ -220,7 +295,11 @@ def main():
     else:
         use_supabase = HAS_SUPABASE
 
-    all_data = {"customers": [], "transactions": [], "sar_cases": []}
+    from sqlalchemy import insert
+    from app.database import SessionLocal
+    from app.models.customer import Customer as CustomerModel
+    from app.models.transaction import Transaction as TransactionModel
+    from app.models.sar_case import SARCase as SARCaseModel
 
     scenarios = [
         ("structuring", ["structuring"]),
@@ -230,82 +309,76 @@ def main():
         ("structuring", ["structuring", "layering"]),
     ]
 
-    for typology, case_typologies in scenarios:
-        customer = generate_customer()
-        all_data["customers"].append(customer)
-        print(f"\n👤 Customer: {customer['name']} ({customer['account_number']})")
-
-        transactions = generate_transactions(customer["customer_id"], typology)
-        all_data["transactions"].extend(transactions)
-        print(f"   💳 {len(transactions)} transactions ({typology})")
-
-        sar_case = generate_sar_case(customer["customer_id"], case_typologies)
-        all_data["sar_cases"].append(sar_case)
-        print(f"   📋 Case: {sar_case['case_id'][:8]}...")
-
-    print("\n📤 Uploading to Database...")
-    from app.database import SessionLocal
-    from app.models.customer import Customer as CustomerModel
-    from app.models.transaction import Transaction as TransactionModel
-    from app.models.sar_case import SARCase as SARCaseModel
+    # Each scenario is written to NDJSON and inserted as soon as it is
+    # generated, so only one scenario's rows are held in memory; the files
+    # keep the data even if the database upload fails
+    counts = {"customers": 0, "transactions": 0, "sar_cases": 0}
+    case_ids = []
 
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     db = SessionLocal()
-    try:
-        # Convert Pydantic-like dicts to SQLAlchemy models
-        for cust_data in all_data["customers"]:
-            # Handle possible field name differences (stated_income vs stated_income)
-            customer = CustomerModel(
-                customer_id=cust_data["customer_id"],
-                name=cust_data["name"],
-                account_number=cust_data["account_number"],
-                occupation=cust_data["occupation"],
-                stated_income=cust_data["stated_income"],
-                customer_since=datetime.strptime(
-                    cust_data["customer_since"], "%Y-%m-%d"
-                ),
-            )
-            db.merge(customer)
-        print(f"   ✅ {len(all_data['customers'])} customers")
-
-        for txn_data in all_data["transactions"]:
-            transaction = TransactionModel(
-                transaction_id=txn_data["transaction_id"],
-                customer_id=txn_data["customer_id"],
-                amount=txn_data["amount"],
-                date=datetime.strptime(txn_data["date"], "%Y-%m-%dT%H:%M:%S"),
-                source_account=txn_data["source_account"],
-                destination_account=txn_data["destination_account"],
-                transaction_type=txn_data["transaction_type"],
-            )
-            db.merge(transaction)
-        print(f"   ✅ {len(all_data['transactions'])} transactions")
-
-        for case_data in all_data["sar_cases"]:
-            sar_case = SARCaseModel(
-                case_id=case_data["case_id"],
-                customer_id=case_data["customer_id"],
-                status=case_data["status"],
-                risk_score=case_data["risk_score"],
-                typologies=case_data["typologies"],
-            )
-            db.merge(sar_case)
-        print(f"   ✅ {len(all_data['sar_cases'])} SAR cases")
-
-        db.commit()
-    except Exception as e:
-        print(f"❌ Database error: {e}")
-        db.rollback()
-    finally:
-        db.close()
+    with ExitStack() as stack:
+        stack.callback(db.close)
+        out = {
+            name: stack.enter_context(open(OUTPUT_DIR / f"{name}.ndjson", "wb"))
+            for name in counts
+        }
+
+        for typology, case_typologies in scenarios:
+            customer = generate_customer()
+            print(f"\n👤 Customer: {customer['name']} ({customer['account_number']})")
+            transactions = generate_transactions(customer["customer_id"], typology)
+            print(f"   💳 {len(transactions)} transactions ({typology})")
+            sar_case = generate_sar_case(customer["customer_id"], case_typologies)
+            print(f"   📋 Case: {sar_case['case_id'][:8]}...")
+
+            _write_ndjson(out["customers"], [customer])
+            _write_ndjson(out["transactions"], transactions)
+            _write_ndjson(out["sar_cases"], [sar_case])
+
+            counts["customers"] += 1
+            counts["transactions"] += len(transactions)
+            counts["sar_cases"] += 1
+            case_ids.append(sar_case["case_id"])
+
+            if db is None:
+                continue
+            try:
+                # IDs are freshly generated, so plain (multi-row) INSERTs
+                # replace a per-row merge()
+                db.execute(insert(CustomerModel), [_customer_row(customer)])
+                db.execute(
+                    insert(TransactionModel),
+                    [_transaction_row(t) for t in transactions],
+                )
+                db.execute(insert(SARCaseModel), [_case_row(sar_case)])
+            except Exception as e:
+                # Keep generating files; the upload is one transaction
+                print(f"❌ Database error: {e}")
+                db.rollback()
+                db = None
+
+        print(f"\n💾 Wrote NDJSON files to {OUTPUT_DIR}")
+
+        if db is not None:
+            try:
+                db.commit()
+                print("📤 Uploaded to Database")
+                print(f"   ✅ {counts['customers']} customers")
+                print(f"   ✅ {counts['transactions']} transactions")
+                print(f"   ✅ {counts['sar_cases']} SAR cases")
+            except Exception as e:
+                print(f"❌ Database error: {e}")
+                db.rollback()
 
     print(f"\n{'=' * 50}")
     print("✨ Data generation complete!")
-    print(f"   Customers: {len(all_data['customers'])}")
-    print(f"   Transactions: {len(all_data['transactions'])}")
-    print(f"   SAR Cases: {len(all_data['sar_cases'])}")
+    print(f"   Customers: {counts['customers']}")
+    print(f"   Transactions: {counts['transactions']}")
+    print(f"   SAR Cases: {counts['sar_cases']}")
     print(f"\n📋 Case IDs for testing:")
-    for case in all_data["sar_cases"]:
-        print(f"   {case['case_id']}")
+    for case_id in case_ids:
+        print(f"   {case_id}")
 
 
 if __name__ == "__main__":
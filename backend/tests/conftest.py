@@ -0,0 +1,25 @@
+"""Shared fixtures for the backend tests."""
+
+import pytest
+
+from app.config import get_settings
+from app.database import get_engine, get_session_factory
+
+
+@pytest.fixture
+def sqlite_session_factory(tmp_path, monkeypatch):
+    """Session factory on a fresh SQLite fallback database in ``tmp_path``.
+
+    The process-wide engine is rebuilt for the test and dropped afterwards,
+    so each test gets an empty ``luminasar.db``.
+    """
+    monkeypatch.setattr(get_settings(), "database_url", "")
+    monkeypatch.chdir(tmp_path)
+    get_engine.cache_clear()
+    get_session_factory.cache_clear()
+    try:
+        yield get_session_factory()
+    finally:
+        get_engine().dispose()
+        get_engine.cache_clear()
+        get_session_factory.cache_clear()
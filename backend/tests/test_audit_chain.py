@@ -0,0 +1,103 @@
+"""Tests for the audit trail hash chain format."""
+
+import hashlib
+
+from app.services.audit_logger import AuditLogger
+from app.utils.hash import (
+    GENESIS_HASH,
+    GENESIS_HASH_BYTES,
+    canonical_json,
+    chain_digest,
+    compute_chain_hash,
+)
+
+PAYLOAD = {
+    "step_name": "fetch_data",
+    "data_sources": {"customer_id": "c1", "transactions": 3},
+    "reasoning": {"note": "₹49,000 deposits"},
+    "confidence_scores": {"confidence": 0.9},
+    "logged_at": "2026-01-01T00:00:00+00:00",
+}
+
+# Pinned digests of PAYLOAD as the first and second link of a chain. If these
+# change, audit rows already stored no longer recompute to their hashes.
+FIRST_LINK = "34f9443974e8195bba0724299eee94e9e7cbdedd9dd5316e7d21456f4dcb376c"
+SECOND_LINK = "24e076d50d3e6d19deaf29694116e6544ad8382d670f7b302f686eb1a7ca2105"
+
+
+def _logged_chain(steps: int = 6) -> AuditLogger:
+    """An audit logger holding ``steps`` entries, as one workflow run writes."""
+    audit_logger = AuditLogger()
+    for n in range(steps):
+        audit_logger.log_step(
+            step_name=f"step_{n}",
+            data_sources={"transaction_ids": [f"t{n}", f"t{n + 1}"]},
+            reasoning={"summary": f"Step {n} reasoning"},
+            outputs={"count": n},
+            confidence=0.5 + n / 20,
+        )
+    return audit_logger
+
+
+def test_canonical_json_is_sorted_and_compact():
+    assert canonical_json(PAYLOAD) == (
+        b'{"confidence_scores":{"confidence":0.9},'
+        b'"data_sources":{"customer_id":"c1","transactions":3},'
+        b'"logged_at":"2026-01-01T00:00:00+00:00",'
+        b'"reasoning":{"note":"\xe2\x82\xb949,000 deposits"},'
+        b'"step_name":"fetch_data"}'
+    )
+
+
+def test_known_vector_digest():
+    digest = chain_digest(GENESIS_HASH_BYTES, PAYLOAD)
+    assert digest == hashlib.sha256(bytes(32) + canonical_json(PAYLOAD)).digest()
+    assert digest.hex() == FIRST_LINK
+    assert compute_chain_hash(GENESIS_HASH, PAYLOAD) == FIRST_LINK
+    assert compute_chain_hash(FIRST_LINK, PAYLOAD) == SECOND_LINK
+
+
+def test_chain_round_trip_verifies():
+    audit_logger = _logged_chain()
+    logs = audit_logger.logs
+
+    assert logs[0]["previous_hash"] == GENESIS_HASH
+    for previous, entry in zip(logs, logs[1:]):
+        assert entry["previous_hash"] == previous["current_hash"]
+    assert audit_logger.verify_chain()
+
+
+def test_entry_hash_matches_its_fields():
+    audit_logger = _logged_chain(2)
+    entry = audit_logger.logs[1]
+    payload = {
+        key: entry[key]
+        for key in (
+            "step_name",
+            "data_sources",
+            "reasoning",
+            "confidence_scores",
+            "logged_at",
+        )
+    }
+    assert entry["current_hash"] == compute_chain_hash(entry["previous_hash"], payload)
+
+
+def test_tampered_middle_row_content_fails():
+    audit_logger = _logged_chain()
+    audit_logger.logs[3]["reasoning"] = {"summary": "edited after the fact"}
+    assert not audit_logger.verify_chain()
+
+
+def test_tampered_middle_row_link_fails():
+    audit_logger = _logged_chain()
+    audit_logger.logs[3]["previous_hash"] = GENESIS_HASH
+    assert not audit_logger.verify_chain()
+
+
+def test_reset_starts_a_new_chain():
+    audit_logger = _logged_chain(2)
+    audit_logger.reset()
+    audit_logger.log_step("fetch_data", {}, {}, {})
+    assert audit_logger.logs[0]["previous_hash"] == GENESIS_HASH
+    assert audit_logger.verify_chain()
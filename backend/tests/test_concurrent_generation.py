@@ -0,0 +1,141 @@
+"""Concurrent SAR generations must not interfere on the database.
+
+Several /generate requests run at once against the SQLite fallback, one of
+them failing mid-save. Every case must end up with exactly what its own
+response reported: one narrative, six audit steps and "generated" status on
+success; nothing saved and "pending" on failure. Ollama and the vector store
+are replaced, so only the database path is exercised.
+"""
+
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.main import app
+from app.models import AuditTrail, Customer, SARCase, SARNarrative, Transaction
+from app.services import langgraph_workflow as workflow
+
+NUM_CASES = 8
+FAILING_CASE = 3
+NARRATIVE = "Subject made cash deposits of ₹49,000 each. Funds moved to ACC2. " * 10
+FAILING_NARRATIVE = "This narrative fails after its INSERT has been flushed."
+
+
+@pytest.fixture
+def cases(sqlite_session_factory):
+    """One customer with a few transactions and a pending case per slot."""
+    seeded = []
+    with sqlite_session_factory() as db:
+        for n in range(NUM_CASES):
+            customer = Customer(
+                name=f"Concurrency Check {n}",
+                account_number=f"CHK{uuid.uuid4().hex[:10]}",
+            )
+            db.add(customer)
+            db.flush()
+            db.add_all(
+                Transaction(
+                    customer_id=customer.customer_id,
+                    amount=49000,
+                    date=datetime(2024, 1, 1) + timedelta(hours=i),
+                    transaction_type="cash_deposit",
+                    source_account="ACC1",
+                    destination_account="ACC2",
+                )
+                for i in range(5)
+            )
+            case = SARCase(customer_id=customer.customer_id, status="pending")
+            db.add(case)
+            db.flush()
+            seeded.append((str(case.case_id), customer.name))
+        db.commit()
+    return seeded
+
+
+@pytest.fixture
+def failing_save(cases):
+    """Abort the save step of the FAILING_CASE generation after its flush."""
+
+    def fail_after_flush(session, flush_context):
+        # The narrative row has reached the database but is not committed
+        for obj in session.new:
+            if getattr(obj, "narrative_text", None) == FAILING_NARRATIVE:
+                raise RuntimeError("simulated save failure")
+
+    def slow_commit(session):
+        # Widen the window between each session's writes and its commit
+        time.sleep(0.05)
+
+    event.listen(Session, "after_flush", fail_after_flush)
+    event.listen(Session, "before_commit", slow_commit)
+    try:
+        yield
+    finally:
+        event.remove(Session, "after_flush", fail_after_flush)
+        event.remove(Session, "before_commit", slow_commit)
+
+
+@pytest.fixture
+def canned_services(cases, monkeypatch):
+    """Replace Ollama and the vector store with canned, slightly slow stubs."""
+    failing_name = cases[FAILING_CASE][1]
+
+    async def generate_narrative(prompt):
+        await asyncio.sleep(random.uniform(0, 0.05))
+        return FAILING_NARRATIVE if failing_name in prompt else NARRATIVE
+
+    rag = workflow.rag_service
+    monkeypatch.setattr(workflow.llm_service, "generate_narrative", generate_narrative)
+    monkeypatch.setattr(rag, "warm_up", lambda: None)
+    monkeypatch.setattr(
+        rag,
+        "retrieve_templates",
+        lambda typologies, top_k=3: [rag._get_default_template()],
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generations_stay_isolated(
+    sqlite_session_factory, cases, failing_save, canned_services
+):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        responses = await asyncio.gather(
+            *(
+                c.post("/api/v1/sar/generate", json={"case_id": case_id})
+                for case_id, _ in cases
+            )
+        )
+
+    assert responses[FAILING_CASE].status_code != 200
+
+    with sqlite_session_factory() as db:
+        for (case_id, _), response in zip(cases, responses):
+            narrative_ids = (
+                db.execute(
+                    select(SARNarrative.narrative_id).where(
+                        SARNarrative.case_id == case_id
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            audit_steps = db.scalar(
+                select(func.count(AuditTrail.audit_id)).where(
+                    AuditTrail.narrative_id.in_(narrative_ids)
+                )
+            )
+            status = db.get(SARCase, case_id).status
+
+            if response.status_code == 200:
+                expected = (1, 6, "generated")
+            else:
+                expected = (0, 0, "pending")
+            assert (len(narrative_ids), audit_steps, status) == expected, case_id
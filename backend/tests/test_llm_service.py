@@ -0,0 +1,50 @@
+"""Tests for streaming narrative generation from Ollama."""
+
+import httpx
+import orjson
+import pytest
+
+from app.services.llm_service import LLMService
+
+
+def _ndjson(*chunks: dict) -> bytes:
+    return b"".join(orjson.dumps(chunk) + b"\n" for chunk in chunks)
+
+
+def _service(body: bytes) -> LLMService:
+    """An LLMService whose Ollama endpoint answers with ``body``."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/generate"
+        return httpx.Response(200, content=body)
+
+    service = LLMService(base_url="http://ollama.test")
+    client = httpx.AsyncClient(
+        base_url=service.base_url, transport=httpx.MockTransport(handler)
+    )
+    service._get_client = lambda: client
+    return service
+
+
+@pytest.mark.asyncio
+async def test_stream_joins_response_chunks():
+    service = _service(
+        _ndjson(
+            {"response": "Subject made "},
+            {"response": "cash deposits."},
+            {"response": "", "done": True},
+        )
+    )
+    assert await service.generate_narrative("prompt") == "Subject made cash deposits."
+
+
+@pytest.mark.asyncio
+async def test_mid_stream_error_is_raised():
+    service = _service(
+        _ndjson(
+            {"response": "Subject made "},
+            {"error": "model runner has unexpectedly stopped"},
+        )
+    )
+    with pytest.raises(Exception, match="unexpectedly stopped"):
+        await service.generate_narrative("prompt")
@@ -0,0 +1,64 @@
+"""Tests for concurrent use of the RAG service from worker threads."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from app.services import rag_service as rag_module
+from app.services.rag_service import RAGService
+
+WORKERS = 8
+
+
+class _SlowModel:
+    """Embedding model stand-in whose load is slow enough to overlap."""
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return np.zeros(384, dtype=np.float32)
+        return np.zeros((len(texts), 384), dtype=np.float32)
+
+
+@pytest.fixture
+def init_counts(monkeypatch):
+    """Count client and model creations, widening the race window."""
+    counts = {"client": 0, "model": 0}
+    lock = threading.Lock()
+    persistent_client = rag_module.chromadb.PersistentClient
+
+    def create_client(**kwargs):
+        with lock:
+            counts["client"] += 1
+        time.sleep(0.05)
+        return persistent_client(**kwargs)
+
+    def load_model():
+        with lock:
+            counts["model"] += 1
+        time.sleep(0.05)
+        return _SlowModel()
+
+    monkeypatch.setattr(rag_module.chromadb, "PersistentClient", create_client)
+    monkeypatch.setattr(rag_module, "_load_embedding_model", load_model)
+    return counts
+
+
+def test_concurrent_warm_up_and_retrieval_initialize_once(tmp_path, init_counts):
+    service = RAGService(persist_directory=str(tmp_path / "chroma"))
+
+    def call(n):
+        if n % 2:
+            service.warm_up()
+            return None
+        return service.retrieve_templates(["structuring"], top_k=3)
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(call, range(WORKERS)))
+
+    assert init_counts == {"client": 1, "model": 1}
+    # The store is empty, so every retrieval falls back to the default
+    for retrieved in results[::2]:
+        assert retrieved[0]["source"] == "default_template"